@@ -1,6 +1,8 @@
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional, Dict, Any
+import numpy as np
 import pinecone
 import openai
 
@@ -47,7 +49,7 @@ class ContextRetriever:
         self.namespace = namespace or os.getenv("PINECONE_NAMESPACE")
 
         if self.index_name not in pinecone.list_indexes():
-            logger.info(f"Creating Pinecone index `{self.index_name}` with dimension {self.dimension}")
+            logger.info("Creating Pinecone index `%s` with dimension %d", self.index_name, self.dimension)
             pinecone.create_index(self.index_name, dimension=self.dimension, metric="cosine")
         self.index = pinecone.Index(self.index_name)
 
@@ -64,12 +66,25 @@ class ContextRetriever:
             logger.exception("Failed to generate embeddings")
             raise
 
-    def index_documents(self, docs: List[str], ids: Optional[List[str]] = None, metadatas: Optional[List[Dict[str, Any]]] = None, batch_size: int = 100):
+    def _index_batch(self, start: int, batch_docs: List[str], batch_ids: List[str], batch_meta: List[Dict[str, Any]], batch_size: int) -> int:
+        try:
+            embeddings = self._embed(batch_docs)
+            to_upsert = list(zip(batch_ids, embeddings, batch_meta))
+            self.index.upsert(vectors=to_upsert, namespace=self.namespace)
+            logger.info("Upserted batch %d: %d vectors", start // batch_size + 1, len(to_upsert))
+            return len(to_upsert)
+        except Exception:
+            logger.exception("Failed to upsert batch starting at index %d", start)
+            raise
+
+    def index_documents(self, docs: List[str], ids: Optional[List[str]] = None, metadatas: Optional[List[Dict[str, Any]]] = None, batch_size: int = 100, max_workers: int = 4):
         """
         Generates embeddings for the provided docs and upserts them into Pinecone.
         docs: list of document strings to index.
         ids: optional list of unique IDs for each document. If None, uses incremental IDs.
         metadatas: optional list of metadata dicts.
+        batch_size: vectors per upsert request (Pinecone rejects large payloads).
+        max_workers: number of batches embedded and upserted concurrently.
         """
         if not docs:
             logger.warning("No documents provided to index.")
@@ -77,18 +92,41 @@ class ContextRetriever:
         total = len(docs)
         ids = ids or [str(i) for i in range(total)]
         metadatas = metadatas or [{} for _ in range(total)]
-        for i in range(0, total, batch_size):
-            batch_docs = docs[i : i + batch_size]
-            batch_ids = ids[i : i + batch_size]
-            batch_meta = metadatas[i : i + batch_size]
-            try:
-                embeddings = self._embed(batch_docs)
-                to_upsert = list(zip(batch_ids, embeddings, batch_meta))
-                self.index.upsert(vectors=to_upsert, namespace=self.namespace)
-                logger.info(f"Upserted batch {i//batch_size + 1}: {len(to_upsert)} vectors")
-            except Exception:
-                logger.exception(f"Failed to upsert batch starting at index {i}")
-                raise
+        starts = range(0, total, batch_size)
+        workers = max(1, min(max_workers, len(starts)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    self._index_batch,
+                    i,
+                    docs[i : i + batch_size],
+                    ids[i : i + batch_size],
+                    metadatas[i : i + batch_size],
+                    batch_size,
+                )
+                for i in starts
+            ]
+            # Check batches in submission order so the first failing batch is the one
+            # raised, and cancel the batches that have not started yet
+            for future in futures:
+                try:
+                    future.result()
+                except Exception:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise
+
+    def _query_matches(self, query_text: str, top_k: int) -> List[Any]:
+        """
+        Returns the typed ScoredVector matches (attributes id, score, metadata).
+        """
+        embedding = self._embed([query_text])[0]
+        query_response = self.index.query(
+            vector=embedding,
+            top_k=top_k,
+            include_metadata=True,
+            namespace=self.namespace
+        )
+        return query_response.matches or []
 
     def query(self, query_text: str, top_k: int = 5) -> List[RelevantDoc]:
         """
@@ -96,24 +134,37 @@ class ContextRetriever:
         Returns a list of RelevantDoc instances.
         """
         try:
-            embedding = self._embed([query_text])[0]
-            query_response = self.index.query(
-                vector=embedding,
-                top_k=top_k,
-                include_metadata=True,
-                namespace=self.namespace
-            )
-            matches = query_response.get("matches", [])
+            matches = self._query_matches(query_text, top_k)
             results: List[RelevantDoc] = []
             for m in matches:
+                metadata = getattr(m, "metadata", None) or {}
                 doc = RelevantDoc(
-                    id=m.get("id"),
-                    score=m.get("score", 0.0),
-                    metadata=m.get("metadata", {}),
-                    content=m.get("metadata", {}).get("text", "")
+                    id=m.id,
+                    score=m.score or 0.0,
+                    metadata=metadata,
+                    content=metadata.get("text", "")
                 )
                 results.append(doc)
             return results
         except Exception:
             logger.exception("Failed to query Pinecone index")
-            return []
\ No newline at end of file
+            return []
+
+    def query_arrays(self, query_text: str, top_k: int = 5) -> Dict[str, Any]:
+        """
+        Queries the Pinecone index like query(), but returns column arrays
+        for callers that rank or filter on scores:
+          {"ids": np.ndarray[str], "scores": np.ndarray[float32], "metadata": [dict, ...]}
+        All three columns share the same order. Empty columns are returned on failure.
+        """
+        try:
+            matches = self._query_matches(query_text, top_k)
+        except Exception:
+            logger.exception("Failed to query Pinecone index")
+            matches = []
+        count = len(matches)
+        return {
+            "ids": np.array([m.id for m in matches], dtype=object),
+            "scores": np.fromiter((m.score or 0.0 for m in matches), dtype=np.float32, count=count),
+            "metadata": [getattr(m, "metadata", None) or {} for m in matches],
+        }
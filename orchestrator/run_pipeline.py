@@ -4,11 +4,10 @@ import json
 import logging
 from typing import List, Any
 
-from validators.validate import validate
+from validators.validate import validate_many
 from orchestrator.rag_retriever import ContextRetriever
 from prompts.chain import AnalysisPromptChain
 from publishers.mcp_publisher import McpPublisher
-from pydantic import ValidationError
 
 def read_input(input_path: str = None) -> str:
     if input_path:
@@ -69,15 +68,12 @@ def main():
 
         # Validate tasks
         validated_tasks = []
-        for idx, rt in enumerate(raw_tasks):
-            try:
-                task_model = validate('task', rt)
-                validated_tasks.append(task_model)
-                logger.debug('Task %d validated: %s', idx, task_model)
-            except ValidationError as ve:
-                logger.error('Validation failed for task %d: %s', idx, ve)
-            except Exception as e:
-                logger.error('Unexpected error validating task %d: %s', idx, e)
+        for idx, (task_model, error) in enumerate(validate_many('task', raw_tasks)):
+            if error is not None:
+                logger.error('Validation failed for task %d: %s', idx, error.errors)
+                continue
+            validated_tasks.append(task_model)
+            logger.debug('Task %d validated: %s', idx, task_model)
 
         if not validated_tasks:
             logger.error('No valid tasks to publish.')
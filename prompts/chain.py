@@ -84,7 +84,7 @@ class AnalysisPromptChain:
             logger.error("Decomposition template not found")
             raise PromptChainError("Missing decomposition_step.j2 template") from e
 
-        prompt = template.render(intent=intent.dict(), context=context or [])
+        prompt = template.render(intent=intent.model_dump(), context=context or [])
         logger.debug("Decompose prompt: %s", prompt)
         response_content = self._call_llm(prompt)
         try:
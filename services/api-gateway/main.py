@@ -320,8 +320,9 @@ async def submit_project_with_files(
             if project_files.size and project_files.size > 50 * 1024 * 1024:  # 50MB limit
                 raise HTTPException(status_code=400, detail="File too large (max 50MB)")
             
-            # Read file content
-            file_content = await project_files.read()
+            # Hand the spooled upload file straight to the ZIP reader instead of
+            # copying the whole archive into memory first
+            project_files.file.seek(0)
             
             # Process uploaded files using the file handler
             hints = {
@@ -329,7 +330,7 @@ async def submit_project_with_files(
                 "main_language": request.main_language,
                 "framework": request.framework
             }
-            uploaded_files = await process_uploaded_zip(file_content, project_files.filename, hints)
+            uploaded_files = await process_uploaded_zip(project_files.file, project_files.filename, hints)
             
         elif request.project_type == "existing_git" and request.git_url:
             # Process Git repository
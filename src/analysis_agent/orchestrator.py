@@ -35,7 +35,14 @@ class Orchestrator:
         if not openai.api_key:
             raise RuntimeError("Environment variable OPENAI_API_KEY must be set")
 
-    def run(self, user_input: str, project_files: Optional[List[str]] = None, project_type: str = "new") -> list[dict]:
+    def is_ready(self) -> bool:
+        """
+        Cheap readiness check: credentials are configured and the prompt/schema
+        directories exist. Does not call the LLM or any MCP server.
+        """
+        return bool(openai.api_key) and self.templates_dir.is_dir() and self.schemas_dir.is_dir()
+
+    def run(self, user_input: str, project_files: Optional[List[str]] = None, project_type: str = "new", enable_mcp: Optional[bool] = None) -> list[dict]:
         """
         Run the orchestrator with optional MCP-enhanced analysis for existing projects
         
@@ -43,8 +50,10 @@ class Orchestrator:
             user_input: The requirement or task description
             project_files: List of file paths for existing project analysis (optional)
             project_type: 'new' for greenfield projects, 'existing' for existing codebases
+            enable_mcp: Override the instance's enable_mcp setting for this call (optional)
         """
-        if self.enable_mcp and project_files and project_type == "existing":
+        use_mcp = self.enable_mcp if enable_mcp is None else enable_mcp
+        if use_mcp and project_files and project_type == "existing":
             return asyncio.run(self._run_with_mcp_analysis(user_input, project_files))
         else:
             return self._run_standard(user_input)
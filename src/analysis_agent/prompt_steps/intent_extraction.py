@@ -1,15 +1,28 @@
+import functools
 import json
 import logging
+import os
 from pathlib import Path
 from typing import Any, Dict
 import openai
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
 
 logger = logging.getLogger(__name__)
 
+TEMPLATE_NAME = "01_intent_extraction.jinja2"
+
 class IntentExtractionError(Exception):
     """Raised when intent extraction step fails."""
 
+@functools.lru_cache(maxsize=32)
+def _load_template(templates_dir: str, mtime_ns: int) -> Template:
+    """
+    Load and compile the intent extraction template once per (directory, mtime).
+    The mtime is part of the cache key so edited templates are picked up.
+    """
+    env = Environment(loader=FileSystemLoader(templates_dir), auto_reload=False)
+    return env.get_template(TEMPLATE_NAME)
+
 def run(input: Dict[str, Any], templates_dir: Path) -> Dict[str, Any]:
     """
     Run the intent extraction prompt step.
@@ -23,11 +36,12 @@ def run(input: Dict[str, Any], templates_dir: Path) -> Dict[str, Any]:
         A dictionary representing the extracted intents.
 
     Raises:
+        FileNotFoundError: If the template file does not exist.
         IntentExtractionError: On template load error, LLM call failure, invalid JSON, or unexpected structure.
     """
+    mtime_ns = os.stat(Path(templates_dir) / TEMPLATE_NAME).st_mtime_ns
     try:
-        env = Environment(loader=FileSystemLoader(str(templates_dir)))
-        template = env.get_template("01_intent_extraction.jinja2")
+        template = _load_template(str(templates_dir), mtime_ns)
     except TemplateNotFound as e:
         msg = f"Intent extraction template not found: {e.name}"
         logger.error(msg)
@@ -77,4 +91,10 @@ def run(input: Dict[str, Any], templates_dir: Path) -> Dict[str, Any]:
         logger.error(msg)
         raise IntentExtractionError(msg)
 
+    # schemas/intent.schema.json requires "intent"
+    if "intent" not in result:
+        msg = "LLM response is missing the required 'intent' key"
+        logger.error(msg)
+        raise IntentExtractionError(msg)
+
     return result
\ No newline at end of file
@@ -7,6 +7,7 @@ Supports multiple input sources:
 - Direct file content
 """
 
+import io
 import os
 import json
 import tempfile
@@ -16,7 +17,7 @@ import subprocess
 import shutil
 import logging
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import BinaryIO, Dict, List, Any, Optional, Union, Tuple
 from dataclasses import dataclass, asdict
 from urllib.parse import urlparse
 import aiofiles
@@ -60,49 +61,109 @@ class FileHandler:
         }
         
     async def process_upload(self, 
-                           uploaded_file: bytes, 
+                           uploaded_file: Union[bytes, BinaryIO], 
                            filename: str,
                            hints: Optional[Dict[str, Any]] = None) -> ProjectFiles:
-        """Process uploaded ZIP file"""
+        """Process uploaded ZIP file
+        
+        uploaded_file may be the raw bytes or a seekable binary file object; file
+        objects are read member by member without copying the whole archive.
+        """
         
         if not filename.lower().endswith('.zip'):
             raise ValueError("Only ZIP files are supported for upload")
-            
-        if len(uploaded_file) > self.max_file_size:
+        
+        upload_size = self._upload_size(uploaded_file)
+        if upload_size > self.max_file_size:
             raise ValueError(f"File too large (max {self.max_file_size // 1024 // 1024}MB)")
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            zip_path = temp_path / filename
-            
-            # Save uploaded file
-            with open(zip_path, 'wb') as f:
-                f.write(uploaded_file)
+        source = io.BytesIO(uploaded_file) if isinstance(uploaded_file, (bytes, bytearray)) else uploaded_file
+        
+        try:
+            # Decompressing and decoding the members is blocking work, so it runs in a
+            # worker thread to keep the event loop (and the API gateway) responsive
+            files = await asyncio.to_thread(self._read_zip, source, hints)
+        except zipfile.BadZipFile:
+            raise ValueError("Invalid ZIP file")
+        
+        return ProjectFiles(
+            files=files,
+            metadata={
+                "source": "upload",
+                "filename": filename,
+                "upload_size": upload_size,
+                "hints": hints or {}
+            },
+            source_type="upload",
+            total_files=len(files),
+            total_size=sum(len(content) for content in files.values())
+        )
+    
+    @staticmethod
+    def _upload_size(uploaded_file: Union[bytes, BinaryIO]) -> int:
+        """Size in bytes of an upload given as bytes or a seekable file object"""
+        if isinstance(uploaded_file, (bytes, bytearray)):
+            return len(uploaded_file)
+        position = uploaded_file.tell()
+        size = uploaded_file.seek(0, io.SEEK_END)
+        uploaded_file.seek(position)
+        return size
+    
+    def _read_zip(self, 
+                  source: BinaryIO, 
+                  hints: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+        """Open the archive and read its text members"""
+        with zipfile.ZipFile(source, 'r') as zip_ref:
+            return self._process_zip_members(zip_ref, hints)
+    
+    @staticmethod
+    def _zip_member_path(name: str) -> str:
+        """
+        Relative path for a ZIP member, matching where extractall would place it:
+        separators normalized and empty, "." and ".." components dropped
+        """
+        parts = name.replace("\\", "/").split("/")
+        return "/".join(part for part in parts if part not in ("", ".", ".."))
+    
+    def _process_zip_members(self, 
+                             zip_ref: zipfile.ZipFile, 
+                             hints: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+        """Read text members straight from the archive, applying the same filters as _process_directory"""
+        
+        files = {}
+        ignore_patterns = self._get_ignore_patterns(hints)
+        
+        for info in zip_ref.infolist():
+            if info.is_dir():
+                continue
             
-            # Extract ZIP
-            try:
-                with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                    zip_ref.extractall(temp_path / "extracted")
-            except zipfile.BadZipFile:
-                raise ValueError("Invalid ZIP file")
+            relative_path_str = self._zip_member_path(info.filename)
+            if not relative_path_str:
+                continue
             
-            extracted_path = temp_path / "extracted"
+            # Check if file should be ignored
+            if self._should_ignore_file(relative_path_str, ignore_patterns):
+                continue
             
-            # Process extracted files
-            files = await self._process_directory(extracted_path, hints)
+            # Check file size
+            if info.file_size > 5 * 1024 * 1024:  # 5MB per file
+                logger.warning(f"Skipping large file: {relative_path_str}")
+                continue
             
-            return ProjectFiles(
-                files=files,
-                metadata={
-                    "source": "upload",
-                    "filename": filename,
-                    "upload_size": len(uploaded_file),
-                    "hints": hints or {}
-                },
-                source_type="upload",
-                total_files=len(files),
-                total_size=sum(len(content) for content in files.values())
-            )
+            # Read file content as text, translating \r\n and \r line endings the
+            # way reading an extracted copy in text mode does
+            try:
+                with zip_ref.open(info) as member, io.TextIOWrapper(member, encoding='utf-8') as f:
+                    files[relative_path_str] = f.read()
+            except (UnicodeDecodeError, PermissionError):
+                # Skip binary files or files we can't read
+                logger.debug(f"Skipping unreadable file: {relative_path_str}")
+                continue
+            except Exception as e:
+                logger.warning(f"Error reading file {relative_path_str}: {e}")
+                continue
+        
+        return files
     
     async def process_git_repository(self, 
                                    git_info: GitRepositoryInfo,
@@ -421,7 +482,7 @@ class FileHandler:
         }
 
 # Convenience functions
-async def process_uploaded_zip(uploaded_file: bytes, 
+async def process_uploaded_zip(uploaded_file: Union[bytes, BinaryIO], 
                              filename: str, 
                              hints: Optional[Dict[str, Any]] = None) -> ProjectFiles:
     """Process uploaded ZIP file"""
@@ -1,8 +1,9 @@
 import os
+import time
 import uuid
 import logging
-from typing import List, Optional, Dict, Any
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+import functools
+from typing import Callable, List, Optional, Dict, Any, TypeVar
 from langchain.embeddings import OpenAIEmbeddings
 from langchain.vectorstores.base import VectorStore
 from langchain.vectorstores import Pinecone, Weaviate, FAISS
@@ -12,10 +13,31 @@ import weaviate
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+F = TypeVar("F", bound=Callable[..., Any])
+
 class VectorStoreError(Exception):
     """Custom exception for VectorStoreClient errors."""
     pass
 
+def _retry(max_attempts: int = 3, min_wait: float = 1, max_wait: float = 10) -> Callable[[F], F]:
+    """
+    Retry the wrapped call on any exception with exponential backoff
+    (min_wait, 2*min_wait, ... capped at max_wait), re-raising the last error.
+    A plain loop keeps the per-call overhead low for fast vector store calls.
+    """
+    def decorator(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            for attempt in range(max_attempts):
+                try:
+                    return fn(*args, **kwargs)
+                except Exception:
+                    if attempt == max_attempts - 1:
+                        raise
+                    time.sleep(min(max_wait, min_wait * 2 ** attempt))
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
 class VectorStoreClient:
     """
     A client for interacting with various vector store backends (Pinecone, Weaviate, FAISS).
@@ -69,12 +91,7 @@ class VectorStoreClient:
             # initialize empty index
             self.client = FAISS.from_texts(texts=[], embedding=self.embeddings)
 
-    @retry(
-        reraise=True,
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type(Exception)
-    )
+    @_retry(max_attempts=3, min_wait=1, max_wait=10)
     def add_texts(self, texts: List[str], metadatas: Optional[List[Dict[str, Any]]] = None, ids: Optional[List[str]] = None) -> List[str]:
         """
         Add texts and optional metadata to the vector store.
@@ -96,12 +113,7 @@ class VectorStoreClient:
             logger.exception("Error adding texts to vector store")
             raise
 
-    @retry(
-        reraise=True,
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type(Exception)
-    )
+    @_retry(max_attempts=3, min_wait=1, max_wait=10)
     def similarity_search(self, query: str, k: int = 4, **kwargs) -> List[Dict[str, Any]]:
         """
         Perform similarity search for a query string.
@@ -125,12 +137,7 @@ class VectorStoreClient:
             logger.exception("Error during similarity search")
             raise
 
-    @retry(
-        reraise=True,
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type(Exception)
-    )
+    @_retry(max_attempts=3, min_wait=1, max_wait=10)
     def delete(self, ids: Optional[List[str]] = None, delete_all: bool = False) -> None:
         """
         Delete entries by ids or clear entire index.
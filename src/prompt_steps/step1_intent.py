@@ -1,21 +1,23 @@
 from dataclasses import dataclass
-import json
-from typing import Any, Dict
-from utils.validator import validate_input as _validate_input, validate_output as _validate_output
+import msgspec
+from typing import Any, Dict, List
+from utils.validator import validate_input as _validate_input, decode_output as _decode_output, convert_output as _convert_output
+from utils.prompt_cache import build_messages
+from utils.llm_cache import cached_llm_call
 from llm_client import llm_client, LLMClientError
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PromptTemplate:
-    template: str = (
+    system: str = (
         "You are an AI assistant. "
         "Given a software requirement, extract the primary intent. "
-        "Requirement: {requirement}. "
         "Respond in JSON with a single key 'intent', whose value is a concise statement."
     )
+    template: str = "Requirement: {requirement}."
 
     def format(self, data: Dict[str, Any]) -> str:
         """
-        Format the prompt text with the provided data.
+        Format the user prompt text with the provided data.
 
         Args:
             data: A dict containing the requirement.
@@ -25,10 +27,23 @@ class PromptTemplate:
         """
         return self.template.format(**data)
 
-@dataclass
-class Intent:
+    def messages(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Build chat messages with the static instructions as a cacheable system prompt.
+
+        Args:
+            data: A dict containing the requirement.
+
+        Returns:
+            A list of chat messages.
+        """
+        return build_messages(self.system, self.format(data))
+
+class Intent(msgspec.Struct, frozen=True, forbid_unknown_fields=True):
     intent: str
 
+_intent_decoder = msgspec.json.Decoder(Intent)
+
 def validate_input(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validate input payload for step 1 (intent extraction) against JSON schema.
@@ -46,7 +61,7 @@ def validate_input(data: Dict[str, Any]) -> Dict[str, Any]:
 
 def validate_output(response: Dict[str, Any]) -> Intent:
     """
-    Validate the LLM response against the intent output schema and convert to Intent.
+    Validate an already-parsed LLM response and convert it to Intent.
 
     Args:
         response: The raw response dict from the LLM.
@@ -57,9 +72,9 @@ def validate_output(response: Dict[str, Any]) -> Intent:
     Raises:
         ValidatorError: If validation fails.
     """
-    validated = _validate_output("intent_output", response)
-    return Intent(**validated)
+    return _convert_output("intent_output", response, Intent)
 
+@cached_llm_call()
 def call_llm(validated_input: Dict[str, Any]) -> Intent:
     """
     Call the LLM to extract the intent based on validated input.
@@ -74,13 +89,12 @@ def call_llm(validated_input: Dict[str, Any]) -> Intent:
         LLMClientError: If the LLM call fails.
         ValidatorError: If response doesn't match the output schema.
     """
-    prompt = PromptTemplate().format(validated_input)
+    messages = PromptTemplate().messages(validated_input)
     try:
-        raw_response = llm_client.generate(prompt)
+        raw_response = llm_client.generate(messages=messages)
     except LLMClientError:
         raise
     try:
-        response_json = json.loads(raw_response)
-    except json.JSONDecodeError as e:
-        raise LLMClientError(f"Failed to parse LLM response as JSON: {e}")
-    return validate_output(response_json)
\ No newline at end of file
+        return _decode_output("intent_output", raw_response, _intent_decoder)
+    except ValueError as e:
+        raise LLMClientError(f"Failed to parse LLM response as JSON: {e}")
\ No newline at end of file
@@ -1,32 +1,36 @@
-from typing import Any, Dict, List, TypedDict
-from utils.validator import validate_input as _validate_input, validate_output as _validate_output, ValidatorError
+from typing import Annotated, Any, Dict, List
+import msgspec
+from utils.validator import validate_input as _validate_input, convert_output as _convert_output, ValidatorError
 from utils.llm import llm_client
+from utils.prompt_cache import build_messages
+from utils.llm_cache import cached_llm_call
 
-class Subtask(TypedDict):
+class Subtask(msgspec.Struct, forbid_unknown_fields=True):
     id: str
     title: str
-    description: str
-    metadata: Dict[str, Any]
-    dependencies: List[str]
+    description: str = ""
+    metadata: Dict[str, Any] = {}
+    dependencies: List[str] = []
 
-class DecomposeOutput(TypedDict):
-    subtasks: List[Subtask]
+class DecomposeOutput(msgspec.Struct, forbid_unknown_fields=True):
+    subtasks: Annotated[List[Subtask], msgspec.Meta(min_length=1)]
 
 class PromptTemplate:
     """
     Defines the prompt template for decomposing a requirement into subtasks.
+    The static instructions are sent as a cacheable system prompt.
     """
-    template: str = (
+    system: str = (
         "You are an expert software engineer. "
-        "Given the following high-level requirement, break it down into a list of subtasks. "
-        "Each subtask should have an id, title, description, metadata, and dependencies.\n\n"
-        "Requirement:\n{requirement}\n\n"
+        "Given a high-level requirement, break it down into a list of subtasks. "
+        "Each subtask should have an id, title, description, metadata, and dependencies. "
         "Return JSON with the key 'subtasks' containing an array of subtasks."
     )
+    template: str = "Requirement:\n{requirement}"
 
     def format(self, inputs: Dict[str, Any]) -> str:
         """
-        Formats the template with the provided inputs.
+        Formats the user prompt with the provided inputs.
 
         Args:
             inputs: A dict containing keys required by the template.
@@ -36,6 +40,18 @@ class PromptTemplate:
         """
         return self.template.format(**inputs)
 
+    def messages(self, inputs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Builds the chat messages for the decomposition call.
+
+        Args:
+            inputs: A dict containing keys required by the template.
+
+        Returns:
+            A list of chat messages.
+        """
+        return build_messages(self.system, self.format(inputs))
+
 def validate_input(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Validates input payload against the decompose_input schema.
@@ -51,6 +67,7 @@ def validate_input(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     return _validate_input("decompose_input", data)
 
+@cached_llm_call()
 def call_llm(validated_input: Dict[str, Any]) -> Dict[str, Any]:
     """
     Calls the LLM client with the formatted decomposition prompt.
@@ -64,8 +81,8 @@ def call_llm(validated_input: Dict[str, Any]) -> Dict[str, Any]:
     Raises:
         Exception: Propagates errors from the LLM client.
     """
-    prompt = PromptTemplate().format(validated_input)
-    response = llm_client.generate(prompt)
+    messages = PromptTemplate().messages(validated_input)
+    response = llm_client.generate(messages=messages)
     if not isinstance(response, dict):
         raise RuntimeError(f"LLM client returned unexpected type: {type(response)}")
     return response
@@ -78,10 +95,9 @@ def validate_output(response: Dict[str, Any]) -> DecomposeOutput:
         response: The raw LLM response dict.
 
     Returns:
-        A DecomposeOutput TypedDict with validated subtasks.
+        A DecomposeOutput with validated subtasks.
 
     Raises:
         ValidatorError: If output validation fails.
     """
-    validated = _validate_output("decompose_output", response)
-    return validated  # type: ignore[arg-type]
\ No newline at end of file
+    return _convert_output("decompose_output", response, DecomposeOutput)
\ No newline at end of file
@@ -1,34 +1,39 @@
 import json
-from typing import TypedDict, List
-from pydantic import BaseModel
-from utils.validator import validate_input as _validate_input, validate_output as _validate_output
+from typing import Annotated, List, Union
+import msgspec
+from utils.validator import validate_input as _validate_input, decode_output as _decode_output, convert_output as _convert_output
 from utils.llm import llm_client
+from utils.prompt_cache import build_messages
+from utils.llm_cache import cached_llm_call
 
-class PromptTemplate(BaseModel):
+SYSTEM_PROMPT = (
+    "Identify potential edge cases related to the subtasks of a requirement. "
+    "Respond with a JSON object matching the edge_output schema."
+)
+
+# subtasks go last: they are the largest and most variable part of the prompt
+USER_TEMPLATE = (
+    "Requirement:\n{requirement}\n\n"
+    "Subtasks:\n{subtasks}"
+)
+
+def _render(data: dict) -> str:
     """
-    Prompt template for extracting edge cases.
+    Render the user prompt for a requirement and its subtasks.
     """
-    template: str = (
-        "Requirement:\n{requirement}\n\n"
-        "Subtasks:\n{subtasks}\n\n"
-        "Identify potential edge cases related to these subtasks. "
-        "Respond with a JSON object matching the edge_output schema."
+    return USER_TEMPLATE.format(
+        requirement=data["requirement"],
+        subtasks=json.dumps(data["subtasks"], indent=2)
     )
 
-    def render(self, data: dict) -> str:
-        return self.template.format(
-            requirement=data["requirement"],
-            subtasks=json.dumps(data["subtasks"], indent=2)
-        )
+class EdgeCase(msgspec.Struct, forbid_unknown_fields=True):
+    subtask_id: str
+    edge_cases: Annotated[List[str], msgspec.Meta(min_length=1)]
 
-class EdgeCase(TypedDict):
-    id: str
-    title: str
-    description: str
-    related_subtask_ids: List[str]
+class EdgeCaseOutput(msgspec.Struct, forbid_unknown_fields=True):
+    edge_cases: Annotated[List[EdgeCase], msgspec.Meta(min_length=1)]
 
-class EdgeCaseOutput(TypedDict):
-    edge_cases: List[EdgeCase]
+_edge_decoder = msgspec.json.Decoder(EdgeCaseOutput)
 
 def validate_input(data: dict) -> dict:
     """
@@ -36,24 +41,25 @@ def validate_input(data: dict) -> dict:
     """
     return _validate_input("edge_input", data)
 
-def call_llm(validated_input: dict) -> dict:
+@cached_llm_call()
+def call_llm(validated_input: dict) -> EdgeCaseOutput:
     """
     Call the LLM to generate edge cases based on requirement and subtasks.
+    The response is parsed and validated against edge_output in one pass.
     """
-    prompt = PromptTemplate().render(validated_input)
-    response = llm_client.chat(messages=[{"role": "user", "content": prompt}])
+    messages = build_messages(SYSTEM_PROMPT, _render(validated_input))
+    response = llm_client.chat(messages=messages)
     try:
         content = response["choices"][0]["message"]["content"]
     except (KeyError, IndexError) as e:
         raise RuntimeError(f"Unexpected LLM response format: {e}") from e
-    try:
-        result = json.loads(content)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"LLM response is not valid JSON: {e}") from e
-    return result
+    return _decode_output("edge_output", content, _edge_decoder)
 
-def validate_output(response: dict) -> EdgeCaseOutput:
+def validate_output(response: Union[dict, EdgeCaseOutput]) -> EdgeCaseOutput:
     """
     Validate the LLM output against edge_output schema.
+    Output already decoded by call_llm is returned unchanged.
     """
-    return _validate_output("edge_output", response) 
\ No newline at end of file
+    if isinstance(response, EdgeCaseOutput):
+        return response
+    return _convert_output("edge_output", response, EdgeCaseOutput) 
\ No newline at end of file
@@ -2,6 +2,8 @@ import os
 import time
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 from utils.metrics import MetricsClient
@@ -10,6 +12,51 @@ from utils.errors import TransientError, PermanentError
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Shared MCP clients keyed by topic so publishers reuse open connections.
+# Each topic holds up to MCP_CLIENT_POOL_SIZE clients handed out round-robin.
+_client_pool: Dict[str, List[Any]] = {}
+_client_pool_next: Dict[str, int] = {}
+_client_pool_lock = threading.Lock()
+
+def _get_or_create_client(topic: str) -> Any:
+    """
+    Return a pooled MCP client for the topic, creating one while the pool is below size.
+    """
+    pool_size = max(1, int(os.getenv("MCP_CLIENT_POOL_SIZE", "4")))
+    with _client_pool_lock:
+        clients = _client_pool.setdefault(topic, [])
+        if len(clients) < pool_size:
+            # credentials loaded via environment by underlying MCP client
+            from mcp_use import MCPClient  # assumed installed library
+            client = MCPClient()
+            clients.append(client)
+            return client
+        index = _client_pool_next.get(topic, 0)
+        _client_pool_next[topic] = (index + 1) % len(clients)
+        return clients[index]
+
+def close_client_pool() -> None:
+    """
+    Close and forget every pooled MCP client.
+    """
+    with _client_pool_lock:
+        for topic, clients in _client_pool.items():
+            for client in clients:
+                close = getattr(client, "close", None)
+                if callable(close):
+                    try:
+                        close()
+                    except Exception:
+                        logger.exception("Error closing MCP client for topic %s", topic)
+        _client_pool.clear()
+        _client_pool_next.clear()
+
+def _body_prefix(request_id: str) -> str:
+    """
+    Serialized payload up to the task value, shared by all tasks of a request.
+    """
+    return '{"request_id": ' + json.dumps(request_id) + ', "task": '
+
 class PublisherError(Exception):
     """Base exception for publisher errors."""
 
@@ -17,84 +64,124 @@ class MCPPublisher:
     """
     MCPPublisher publishes validated tasks to the MCP 'tasks.analysis' topic.
     Retries on transient failures, logs metrics for publish attempts.
+    publish_all fans tasks out over a thread pool of `concurrency` workers.
     """
     def __init__(
         self,
         topic: Optional[str] = None,
         max_retries: int = 3,
         backoff_factor: float = 2.0,
-        initial_backoff: float = 1.0
+        initial_backoff: float = 1.0,
+        concurrency: int = 8
     ):
         self.topic = topic or os.getenv("MCP_ANALYSIS_TOPIC", "tasks.analysis")
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
         self.initial_backoff = initial_backoff
+        self.concurrency = max(1, concurrency)
         self.metrics = MetricsClient()
-        # credentials loaded via environment by underlying MCP client
-        from mcp_use import MCPClient  # assumed installed library
-        self.client = MCPClient()
+        self._metrics_lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self.client = _get_or_create_client(self.topic)
 
-    def publish(self, task: Dict[str, Any], request_id: str) -> str:
+    def publish(
+        self,
+        task: Dict[str, Any],
+        request_id: str,
+        headers: Optional[Dict[str, str]] = None,
+        body_prefix: Optional[str] = None
+    ) -> str:
         """
         Publish a single task to the analysis topic.
         Attaches request_id for idempotency.
+        headers and body_prefix may be passed in when publishing many tasks
+        for the same request so they are built only once.
         Returns the message ID on success.
         Raises PublisherError on permanent failure.
         """
-        payload = {
-            "request_id": request_id,
-            "task": task
-        }
-        body = json.dumps(payload)
-        headers = {"request_id": request_id}
+        if body_prefix is None:
+            body_prefix = _body_prefix(request_id)
+        # same bytes as json.dumps({"request_id": ..., "task": ...})
+        body = body_prefix + json.dumps(task) + "}"
+        if headers is None:
+            headers = {"request_id": request_id}
+        task_id = task.get("id")
         attempt = 0
         backoff = self.initial_backoff
         while attempt <= self.max_retries:
             try:
-                start = time.time()
+                start = time.perf_counter()
                 message_id = self.client.publish(
                     topic=self.topic,
                     body=body,
                     headers=headers
                 )
-                latency = time.time() - start
-                self.metrics.record_timer("mcp.publish.latency", latency)
-                self.metrics.increment_counter("mcp.publish.success")
-                logger.info(f"Published task id={task.get('id')} msg_id={message_id}")
+                latency = time.perf_counter() - start
+                with self._metrics_lock:
+                    self.metrics.record_timer("mcp.publish.latency", latency)
+                    self.metrics.increment_counter("mcp.publish.success")
+                logger.info("Published task id=%s msg_id=%s", task_id, message_id)
                 return message_id
             except TransientError as te:
                 attempt += 1
-                self.metrics.increment_counter("mcp.publish.retry")
+                with self._metrics_lock:
+                    self.metrics.increment_counter("mcp.publish.retry")
                 logger.warning(
-                    f"Transient error publishing task id={task.get('id')} attempt={attempt}/{self.max_retries}: {te}"
+                    "Transient error publishing task id=%s attempt=%d/%d: %s",
+                    task_id, attempt, self.max_retries, te
                 )
                 if attempt > self.max_retries:
-                    self.metrics.increment_counter("mcp.publish.failure")
-                    raise PublisherError(f"Max retries exceeded for task {task.get('id')}") from te
+                    with self._metrics_lock:
+                        self.metrics.increment_counter("mcp.publish.failure")
+                    raise PublisherError(f"Max retries exceeded for task {task_id}") from te
                 time.sleep(backoff)
                 backoff *= self.backoff_factor
             except PermanentError as pe:
-                self.metrics.increment_counter("mcp.publish.failure")
-                logger.error(f"Permanent error publishing task id={task.get('id')}: {pe}")
-                raise PublisherError(f"Permanent failure for task {task.get('id')}") from pe
+                with self._metrics_lock:
+                    self.metrics.increment_counter("mcp.publish.failure")
+                logger.error("Permanent error publishing task id=%s: %s", task_id, pe)
+                raise PublisherError(f"Permanent failure for task {task_id}") from pe
             except Exception as e:
-                self.metrics.increment_counter("mcp.publish.failure")
-                logger.exception(f"Unexpected error publishing task id={task.get('id')}")
-                raise PublisherError(f"Unexpected error for task {task.get('id')}: {e}") from e
+                with self._metrics_lock:
+                    self.metrics.increment_counter("mcp.publish.failure")
+                logger.exception("Unexpected error publishing task id=%s", task_id)
+                raise PublisherError(f"Unexpected error for task {task_id}: {e}") from e
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Lazily create the worker pool shared by all publish_all calls.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.concurrency,
+                    thread_name_prefix="mcp-publish"
+                )
+            return self._executor
 
     def publish_all(self, tasks: List[Dict[str, Any]], request_id: str) -> Dict[str, Any]:
         """
-        Publish all validated tasks. Returns a summary dict:
+        Publish all validated tasks concurrently. Returns a summary dict:
           {
             "published": [message_id, ...],
             "failed": [{"task_id": ..., "error": ...}, ...]
           }
+        Entries in both lists keep the order of the input tasks.
         """
         summary = {"published": [], "failed": []}
-        for task in tasks:
+        if not tasks:
+            return summary
+        executor = self._get_executor()
+        headers = {"request_id": request_id}
+        body_prefix = _body_prefix(request_id)
+        futures = [
+            executor.submit(self.publish, task, request_id, headers, body_prefix)
+            for task in tasks
+        ]
+        for task, future in zip(tasks, futures):
             try:
-                msg_id = self.publish(task, request_id)
-                summary["published"].append(msg_id)
+                summary["published"].append(future.result())
             except PublisherError as e:
                 summary["failed"].append({
                     "task_id": task.get("id"),
@@ -102,6 +189,16 @@ class MCPPublisher:
                 })
         return summary
 
+    def close(self) -> None:
+        """
+        Shut down the publish worker pool. Safe to call more than once.
+        Pooled MCP clients stay open for other publishers; see close_client_pool.
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
 if __name__ == "__main__":
     # example usage
     import uuid
@@ -109,4 +206,6 @@ if __name__ == "__main__":
     sample_tasks = [{"id": "t1", "description": "do X"}, {"id": "t2", "description": "do Y"}]
     publisher = MCPPublisher()
     result = publisher.publish_all(sample_tasks, request_id)
+    publisher.close()
+    close_client_pool()
     print(json.dumps(result, indent=2))
\ No newline at end of file
@@ -2,22 +2,31 @@ import json
 import os
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Type
+import importlib
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
 
 import jsonschema
+import jsonschema.validators
 from jsonschema import Draft7Validator, ValidationError as JsonSchemaValidationError
 
-try:
-    from google.protobuf.json_format import ParseDict, MessageConversionError
+if TYPE_CHECKING:
     from google.protobuf.message import Message as ProtoMessage
-except ImportError:
-    ParseDict = None
-    MessageConversionError = None
-    ProtoMessage = None
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+@lru_cache(maxsize=1)
+def _protobuf_json_format() -> Optional[Any]:
+    """
+    Import google.protobuf.json_format on first proto validation.
+    Returns None when protobuf is not installed.
+    """
+    try:
+        return importlib.import_module("google.protobuf.json_format")
+    except ImportError:
+        return None
+
 class SchemaValidationError(Exception):
     """
     Exception raised when schema validation fails.
@@ -37,7 +46,7 @@ class SchemaValidator:
     def __init__(
         self,
         json_schema_path: Optional[Path] = None,
-        proto_message_cls: Optional[Type[ProtoMessage]] = None
+        proto_message_cls: Optional[Type["ProtoMessage"]] = None
     ):
         """
         :param json_schema_path: Path to JSON Schema file.
@@ -56,14 +65,27 @@ class SchemaValidator:
             raise FileNotFoundError(msg)
         with open(self.json_schema_path, 'r', encoding='utf-8') as f:
             self._json_schema = json.load(f)
-        self._json_validator = Draft7Validator(self._json_schema)
+        validator_cls = jsonschema.validators.validator_for(self._json_schema, default=Draft7Validator)
+        validator_cls.check_schema(self._json_schema)
+        self._json_validator = validator_cls(self._json_schema)
         logger.debug("Loaded JSON Schema from %s", self.json_schema_path)
 
+    def is_valid(self, obj: Dict[str, Any]) -> bool:
+        """
+        Check a dict against the loaded JSON Schema, stopping at the first error.
+        """
+        return self._json_validator.is_valid(obj)
+
     def validate_json(self, obj: Dict[str, Any]) -> Tuple[bool, List[Dict[str, Any]]]:
         """
         Validate a dict against the loaded JSON Schema.
+        Valid objects take the short-circuiting is_valid path; the full
+        error list is only collected when validation fails.
         :returns: (is_valid, errors)
         """
+        if self._json_validator.is_valid(obj):
+            logger.debug("JSON validation succeeded")
+            return True, []
         errors: List[Dict[str, Any]] = []
         for err in self._json_validator.iter_errors(obj):
             error_detail = {
@@ -72,28 +94,25 @@ class SchemaValidator:
                 "schema_path": list(err.absolute_schema_path)
             }
             errors.append(error_detail)
-        is_valid = not errors
-        if is_valid:
-            logger.debug("JSON validation succeeded")
-        else:
-            logger.warning("JSON validation failed with %d errors", len(errors))
-        return is_valid, errors
+        logger.warning("JSON validation failed with %d errors", len(errors))
+        return False, errors
 
     def validate_proto(self, obj: Dict[str, Any]) -> Tuple[bool, List[Dict[str, Any]]]:
         """
         Validate a dict by parsing it into a Protobuf message.
         :returns: (is_valid, errors)
         """
-        if self.proto_message_cls is None or ParseDict is None:
+        json_format = _protobuf_json_format() if self.proto_message_cls is not None else None
+        if json_format is None:
             msg = "Protobuf validation requested but no proto_message_cls provided or protobuf libraries not available"
             logger.error(msg)
             raise RuntimeError(msg)
         try:
-            message: ProtoMessage = self.proto_message_cls()
-            ParseDict(obj, message)
+            message: "ProtoMessage" = self.proto_message_cls()
+            json_format.ParseDict(obj, message)
             logger.debug("Protobuf validation succeeded")
             return True, []
-        except MessageConversionError as e:
+        except json_format.ParseError as e:
             logger.warning("Protobuf validation failed: %s", str(e))
             return False, [{"message": str(e), "path": []}]
 
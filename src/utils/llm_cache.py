@@ -0,0 +1,67 @@
+import functools
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, TypeVar
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+T = TypeVar("T")
+
+DEFAULT_MAXSIZE = int(os.getenv("AFK_LLM_CACHE_SIZE", "10000"))
+
+def _canonical(payload: Dict[str, Any]) -> bytes:
+    """
+    Serialize a payload with sorted keys so equal inputs hash identically.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+def input_key(payload: Dict[str, Any]) -> str:
+    """
+    Return the content hash used as cache key for an LLM step input.
+    """
+    return hashlib.sha256(_canonical(payload)).hexdigest()
+
+def cached_llm_call(maxsize: int = DEFAULT_MAXSIZE) -> Callable[[Callable[[Dict[str, Any]], T]], Callable[[Dict[str, Any]], T]]:
+    """
+    Decorate a step's call_llm so identical validated inputs return the
+    previously parsed output without another LLM request.
+    Entries are evicted least-recently-used once maxsize is reached; a
+    maxsize of 0 disables caching. Only successful results are stored.
+    Cached results are shared between callers and must not be mutated.
+    """
+    def decorator(fn: Callable[[Dict[str, Any]], T]) -> Callable[[Dict[str, Any]], T]:
+        if maxsize <= 0:
+            return fn
+        entries: "OrderedDict[str, T]" = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(validated_input: Dict[str, Any]) -> T:
+            key = input_key(validated_input)
+            with lock:
+                if key in entries:
+                    entries.move_to_end(key)
+                    return entries[key]
+            result = fn(validated_input)
+            with lock:
+                entries[key] = result
+                entries.move_to_end(key)
+                if len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return result
+
+        def cache_clear() -> None:
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        return wrapper
+    return decorator
@@ -3,9 +3,34 @@ import os
 import sys
 import json
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 import contextvars
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from requests.exceptions import Timeout as RequestsTimeout, ConnectionError as RequestsConnectionError
+except ImportError:
+    RequestsTimeout = None
+    RequestsConnectionError = None
+
+def _dumps(obj: Dict[str, Any]) -> str:
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except (TypeError, orjson.JSONEncodeError):
+            # e.g. ints wider than 64 bits, which json.dumps still encodes
+            pass
+    return json.dumps(obj, default=str)
+
+# Attributes every LogRecord carries; anything else on a record came from `extra=`
+_STD_LOGRECORD_ATTRS = frozenset(
+    logging.LogRecord("", logging.INFO, "", 0, "", (), None).__dict__.keys()
+) | {"message", "asctime", "taskName"}
+
 # Context variable for request ID propagation
 _request_id_ctx_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("request_id", default=None)
 
@@ -39,13 +64,36 @@ class JsonFormatter(logging.Formatter):
     """
     Formatter that outputs logs in JSON format.
     """
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (epoch second, formatted prefix) of the last default-format timestamp
+        self._time_cache: Tuple[Optional[int], str] = (None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        return self.format_timestamp(record.created)
+
+    def format_timestamp(self, created: float) -> str:
+        """
+        Format an epoch timestamp in the default format, reusing the
+        strftime result while the second has not changed.
+        """
+        second = int(created)
+        cached_second, prefix = self._time_cache
+        if cached_second != second:
+            prefix = time.strftime(self.default_time_format, self.converter(created))
+            self._time_cache = (second, prefix)
+        return self.default_msec_format % (prefix, int((created - second) * 1000))
+
     def format(self, record: logging.LogRecord) -> str:
+        attrs = record.__dict__
         log_record: Dict[str, Any] = {
             "timestamp": self.formatTime(record, self.datefmt),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
-            "request_id": getattr(record, "request_id", None),
+            "request_id": attrs.get("request_id"),
             "module": record.module,
             "funcName": record.funcName,
             "lineNo": record.lineno,
@@ -56,10 +104,10 @@ class JsonFormatter(logging.Formatter):
         if record.stack_info:
             log_record["stack_info"] = self.formatStack(record.stack_info)
         # include any extra attributes
-        for key, value in record.__dict__.items():
-            if key not in log_record and key not in ("msg", "args", "exc_info", "stack_info"):
-                log_record[key] = value
-        return json.dumps(log_record, default=str)
+        for key in attrs.keys() - _STD_LOGRECORD_ATTRS:
+            if key not in log_record:
+                log_record[key] = attrs[key]
+        return _dumps(log_record)
 
 def configure_logger(
     name: Optional[str] = None,
@@ -96,16 +144,49 @@ def log_metric(name: str, value: float, tags: Optional[Dict[str, Any]] = None) -
     """
     Emit a metric event into the log stream.
     The metric will appear as INFO level with structured fields.
-    """
-    logger = configure_logger(__name__)
+    When the logger has a single JSON stream handler that accepts INFO, uses the
+    default date format and has no filters besides RequestIdFilter, the line is
+    serialized once and written straight to the handler stream, skipping
+    LogRecord creation and the formatter.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    now = time.time()
+    request_id = get_request_id()
     metric_record = {
         "metric": name,
         "value": value,
         "tags": tags or {},
-        "timestamp": time.time(),
-        "request_id": get_request_id(),
+        "timestamp": now,
+        "request_id": request_id,
     }
-    logger.info("metric", extra={"metric_record": metric_record})
+    handler = logger.handlers[0] if len(logger.handlers) == 1 else None
+    if (
+        isinstance(handler, logging.StreamHandler)
+        and isinstance(handler.formatter, JsonFormatter)
+        and handler.formatter.datefmt is None
+        and handler.level <= logging.INFO
+        and all(isinstance(f, RequestIdFilter) for f in handler.filters)
+    ):
+        # Same fields JsonFormatter writes, with the caller's location as logging would report it
+        caller = sys._getframe(1)
+        code = caller.f_code
+        line = _dumps({
+            "timestamp": handler.formatter.format_timestamp(now),
+            "level": "INFO",
+            "logger": logger.name,
+            "message": "metric",
+            "request_id": request_id,
+            "module": os.path.splitext(os.path.basename(code.co_filename))[0],
+            "funcName": code.co_name,
+            "lineNo": caller.f_lineno,
+            "metric_record": metric_record,
+        })
+        with handler.lock:
+            handler.stream.write(line + handler.terminator)
+            handler.flush()
+        return
+    logger.info("metric", extra={"metric_record": metric_record}, stacklevel=2)
 
 class ErrorCategory:
     LLM_TIMEOUT = "llm_timeout"
@@ -114,22 +195,22 @@ class ErrorCategory:
     PUBLISHER_UNREACHABLE = "publisher_unreachable"
     UNKNOWN = "unknown"
 
+class LLMTimeoutError(Exception):
+    """Raised by LLM client wrappers when a completion times out."""
+
+class VectorStoreError(Exception):
+    """Raised by vector store wrappers when the backend is unavailable."""
+
+_TIMEOUT_ERRORS = (RequestsTimeout, LLMTimeoutError) if RequestsTimeout else (LLMTimeoutError,)
+_VECTOR_STORE_ERRORS = (RequestsConnectionError, VectorStoreError) if RequestsConnectionError else (VectorStoreError,)
+
 def classify_error(exc: Exception) -> str:
     """
     Classify an exception into one of the predefined categories.
     """
-    from requests.exceptions import Timeout, ConnectionError
-
-    # Example LLM SDK exceptions
-    class LLMTimeoutError(Exception):
-        pass
-
-    class VectorStoreError(Exception):
-        pass
-
-    if isinstance(exc, Timeout) or isinstance(exc, LLMTimeoutError):
+    if isinstance(exc, _TIMEOUT_ERRORS):
         return ErrorCategory.LLM_TIMEOUT
-    if isinstance(exc, ConnectionError) or isinstance(exc, VectorStoreError):
+    if isinstance(exc, _VECTOR_STORE_ERRORS):
         return ErrorCategory.VECTOR_STORE_DOWN
     if isinstance(exc, ValueError) and "schema" in str(exc).lower():
         return ErrorCategory.SCHEMA_VIOLATION
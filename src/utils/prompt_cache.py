@@ -0,0 +1,19 @@
+from typing import Any, Dict, List
+
+EPHEMERAL_CACHE = {"type": "ephemeral"}
+
+def build_messages(system_prompt: str, user_prompt: str) -> List[Dict[str, Any]]:
+    """
+    Build chat messages with the static system prompt marked cacheable.
+    Providers that support prompt caching reuse the marked prefix across
+    calls, so only the dynamic user prompt is processed each time.
+    """
+    return [
+        {
+            "role": "system",
+            "content": [
+                {"type": "text", "text": system_prompt, "cache_control": EPHEMERAL_CACHE}
+            ],
+        },
+        {"role": "user", "content": user_prompt},
+    ]
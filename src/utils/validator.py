@@ -1,7 +1,16 @@
 from pathlib import Path
 import json
+import os
+import msgspec
 from jsonschema import Draft7Validator
-from typing import Any, Dict
+from typing import Any, Dict, Type, TypeVar, Union
+
+_SCHEMAS_DIR = Path(__file__).resolve().parents[1] / "schemas"
+
+# When set, typed outputs are re-checked against the JSON schema files as well
+STRICT_SCHEMA = os.getenv("AFK_STRICT_SCHEMA", "false").lower() in ("1", "true", "yes")
+
+T = TypeVar("T")
 
 class ValidatorError(Exception):
     """Exception raised when JSON schema validation fails."""
@@ -13,7 +22,7 @@ class ValidatorError(Exception):
 def _load_schemas() -> Dict[str, Dict[str, Any]]:
     """Load all JSON schemas from the schemas directory."""
     schemas: Dict[str, Dict[str, Any]] = {}
-    base_dir = Path(__file__).resolve().parents[1] / "schemas"
+    base_dir = _SCHEMAS_DIR
     if not base_dir.is_dir():
         raise RuntimeError(f"Schemas directory not found at {base_dir}")
     for path in base_dir.glob("*.json"):
@@ -25,13 +34,21 @@ def _load_schemas() -> Dict[str, Dict[str, Any]]:
     return schemas
 
 _SCHEMAS = _load_schemas()
+_VALIDATORS: Dict[str, Draft7Validator] = {}
+
+def _get_validator(name: str) -> Draft7Validator:
+    """Return the compiled validator for a schema, building it on first use."""
+    validator = _VALIDATORS.get(name)
+    if validator is None:
+        schema = _SCHEMAS.get(name)
+        if schema is None:
+            raise ValidatorError(name, f"Schema '{name}' not found")
+        validator = _VALIDATORS[name] = Draft7Validator(schema)
+    return validator
 
 def _validate(name: str, payload: Any) -> Any:
     """Validate a payload against a named JSON schema."""
-    schema = _SCHEMAS.get(name)
-    if schema is None:
-        raise ValidatorError(name, f"Schema '{name}' not found")
-    validator = Draft7Validator(schema)
+    validator = _get_validator(name)
     errors = sorted(validator.iter_errors(payload), key=lambda e: e.path)
     if errors:
         error = errors[0]
@@ -51,4 +68,31 @@ def validate_output(name: str, payload: Any) -> Any:
     Validate payload as output against the specified schema.
     Raises ValidatorError on validation failure.
     """
-    return _validate(name, payload)
\ No newline at end of file
+    return _validate(name, payload)
+
+def decode_output(name: str, raw: Union[str, bytes], decoder: "msgspec.json.Decoder[T]") -> T:
+    """
+    Parse and validate raw JSON output in a single pass with a typed msgspec decoder.
+    Raises ValueError if raw is not JSON and ValidatorError if it does not match the type.
+    """
+    try:
+        result = decoder.decode(raw)
+    except msgspec.ValidationError as e:
+        raise ValidatorError(name, str(e)) from e
+    except msgspec.DecodeError as e:
+        raise ValueError(f"Output for schema '{name}' is not valid JSON: {e}") from e
+    if STRICT_SCHEMA:
+        _validate(name, msgspec.to_builtins(result))
+    return result
+
+def convert_output(name: str, payload: Any, type_: Type[T]) -> T:
+    """
+    Validate an already-parsed payload and convert it to the given msgspec type.
+    Raises ValidatorError on validation failure.
+    """
+    if STRICT_SCHEMA:
+        _validate(name, payload)
+    try:
+        return msgspec.convert(payload, type_)
+    except msgspec.ValidationError as e:
+        raise ValidatorError(name, str(e)) from e
@@ -4,9 +4,46 @@ Test script to submit a simple project request and generate Jaeger traces.
 Run this after starting the services to see distributed tracing in action.
 """
 
+import os
+import socket
 import requests
 import time
 import json
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+# One keep-alive connection pool shared by all API Gateway requests
+session = requests.Session()
+session.mount("http://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
+def wait_for_pipeline_start(api_url, request_id, timeout=30.0):
+    """Poll /status with a short backoff (0.1s -> 1s) until the request is no longer queued.
+    
+    Returns the last status payload seen, or None if no status could be read.
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.1
+    status = None
+    while time.monotonic() < deadline:
+        response = session.get(f"{api_url}/status/{request_id}", timeout=5)
+        if response.status_code == 200:
+            status = json_loads(response.content)
+            if status.get("status") not in (None, "queued"):
+                break
+        time.sleep(delay)
+        delay = min(delay * 1.5, 1.0)
+    return status
 
 def test_jaeger_tracing():
     """Submit a test project to generate traces"""
@@ -39,24 +76,20 @@ def test_jaeger_tracing():
     
     try:
         # Submit the project
-        response = requests.post(f"{api_url}/submit", json=test_project, timeout=30)
+        response = session.post(f"{api_url}/submit", json=test_project, timeout=30)
         
         if response.status_code == 200:
-            result = response.json()
+            result = json_loads(response.content)
             request_id = result["request_id"]
             print(f"✅ Project submitted successfully!")
             print(f"   Request ID: {request_id}")
             print(f"   Status: {result['status']}")
             print(f"   Message: {result['message']}")
             
-            # Wait a bit for the pipeline to process
+            # Poll until the pipeline leaves the queue instead of sleeping blindly
             print("\n⏳ Waiting for pipeline to process...")
-            time.sleep(5)
-            
-            # Check status
-            status_response = requests.get(f"{api_url}/status/{request_id}")
-            if status_response.status_code == 200:
-                status = status_response.json()
+            status = wait_for_pipeline_start(api_url, request_id)
+            if status is not None:
                 print(f"📊 Current Status: {status.get('status', 'unknown')}")
                 print(f"   Current Stage: {status.get('current_stage', 'unknown')}")
             
@@ -78,21 +111,26 @@ def test_jaeger_tracing():
         print("   Make sure the services are running with: ./start.sh")
         return None
 
-def check_jaeger_ui():
-    """Check if Jaeger UI is accessible"""
+@lru_cache(maxsize=1)
+def jaeger_up():
+    """TCP connect probe for the Jaeger UI port, done once per process"""
     try:
-        response = requests.get("http://localhost:16686", timeout=5)
-        if response.status_code == 200:
-            print("✅ Jaeger UI is accessible at http://localhost:16686")
+        with socket.create_connection(("localhost", 16686), timeout=0.1):
             return True
-        else:
-            print(f"⚠️  Jaeger UI returned status {response.status_code}")
-            return False
-    except requests.exceptions.RequestException:
-        print("❌ Jaeger UI is not accessible at http://localhost:16686")
-        print("   Make sure Jaeger is running in Docker Compose")
+    except OSError:
         return False
 
+def check_jaeger_ui():
+    """Check if Jaeger UI is accessible (skipped when FAST=1)"""
+    if os.environ.get("FAST"):
+        return True
+    if jaeger_up():
+        print("✅ Jaeger UI is accessible at http://localhost:16686")
+        return True
+    print("❌ Jaeger UI is not accessible at http://localhost:16686")
+    print("   Make sure Jaeger is running in Docker Compose")
+    return False
+
 def main():
     print("🚀 Jaeger Tracing Test for MCP Agent Swarm")
     print("=" * 60)
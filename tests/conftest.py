@@ -0,0 +1,54 @@
+"""Shared pytest configuration for the test suite."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Put the import roots on sys.path once for every test module instead of each
+# module appending its own (often machine-specific) paths at import time.
+for path in (
+    ROOT / "services" / "analysis-agent",
+    ROOT / "services",
+    ROOT / "src",
+    ROOT,
+):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from tests.project_samples import load_existing_project_zip, make_tiny_git_repo
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--skip-slow",
+        action="store_true",
+        default=False,
+        help="skip tests marked slow",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--skip-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test (--skip-slow)")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def existing_project_zip():
+    """The sample existing-project archive, read and parsed once per test session."""
+    project_zip = load_existing_project_zip()
+    yield project_zip
+    if project_zip is not None:
+        project_zip.zip.close()
+
+
+@pytest.fixture(scope="session")
+def tiny_git_repo(tmp_path_factory):
+    """file:// URL of a local one-commit bare repository, built once per test session."""
+    return make_tiny_git_repo(tmp_path_factory.mktemp("git"))
@@ -0,0 +1,42 @@
+"""Sample project inputs shared by the pytest fixtures and the standalone test scripts."""
+
+import io
+import subprocess
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+
+EXISTING_PROJECT_ZIP = Path(__file__).resolve().parent / "test_existing_project.zip"
+
+
+def load_existing_project_zip(path: Path = EXISTING_PROJECT_ZIP):
+    """
+    Read the sample existing-project archive into memory.
+
+    Returns a namespace with the raw ``bytes``, the opened ``zip`` and its member
+    ``names``, or None if the archive is not present.
+    """
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    archive = zipfile.ZipFile(io.BytesIO(data))
+    return SimpleNamespace(bytes=data, zip=archive, names=archive.namelist())
+
+
+def make_tiny_git_repo(base: Path) -> str:
+    """
+    Create a bare repository under ``base`` holding one commit on ``master``.
+
+    Returns its file:// URL so clone code paths run without network access.
+    """
+    bare = base / "repo.git"
+    work = base / "work"
+    git = ["git", "-c", "user.email=test@example.com", "-c", "user.name=test"]
+    subprocess.check_call(["git", "init", "-q", "--bare", str(bare)])
+    subprocess.check_call(["git", "init", "-q", str(work)])
+    (work / "README.md").write_text("# Hello World\n")
+    subprocess.check_call(git + ["-C", str(work), "add", "."])
+    subprocess.check_call(git + ["-C", str(work), "commit", "-qm", "Initial commit"])
+    subprocess.check_call(git + ["-C", str(work), "push", "-q", str(bare), "HEAD:master"])
+    return bare.as_uri()
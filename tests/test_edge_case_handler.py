@@ -1,8 +1,6 @@
 import pytest
 from src.edge_case_handler import handle_edge_case_x
 
-@pytest.mark.asyncio
-async def test_handle_edge_case_x_not_implemented():
-    with pytest.raises(NotImplementedError) as exc_info:
-        await handle_edge_case_x()
-    assert "REQ-456 not yet implemented" in str(exc_info.value)
\ No newline at end of file
+def test_handle_edge_case_x_not_implemented():
+    with pytest.raises(NotImplementedError, match="REQ-456 not yet implemented"):
+        handle_edge_case_x(None)
@@ -8,19 +8,47 @@ import sys
 import json
 from pathlib import Path
 
-# Add project root to path
-sys.path.append('/home/flip/Desktop/test_swarm')
+import pytest
+
+if __name__ == "__main__":
+    # Run as a script, so pytest has not loaded conftest.py to set up the import roots
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    import tests.conftest  # noqa: F401
 
 from src.common.file_handler import process_uploaded_zip, process_git_repo
 
-async def demo_existing_project_workflow():
+# Example payload shown by the demo; formatted once per process since indent=2
+# goes through json's slower pure-Python encoder
+EXAMPLE_REQUEST = {
+    "project_name": "MyApp Enhancement",
+    "description": "Add user authentication and API rate limiting to my existing FastAPI + React application",
+    "requirements": [
+        "JWT-based user authentication",
+        "User registration and login endpoints", 
+        "Protected API routes with middleware",
+        "React login/signup components",
+        "API rate limiting with Redis",
+        "Session management"
+    ],
+    "project_type": "existing_local",  # or "existing_git"
+    "priority": "high",
+    "technology_preferences": ["FastAPI", "React", "TypeScript", "Redis", "JWT"],
+    "main_language": "python",  # detected automatically
+    "framework": "fastapi"     # detected automatically
+}
+EXAMPLE_REQUEST_JSON = json.dumps(EXAMPLE_REQUEST, indent=2)
+
+async def demo_existing_project_workflow(existing_project_zip):
     """Demonstrate the complete existing project workflow"""
+    # Collect the report and write it in one go instead of a print per line
+    lines = []
+    emit = lines.append
     
-    print("EXISTING PROJECT WORKFLOW DEMONSTRATION")
-    print("=" * 60)
+    emit("EXISTING PROJECT WORKFLOW DEMONSTRATION")
+    emit("=" * 60)
     
-    print("\nHow it works for existing projects:")
-    print("""
+    emit("\nHow it works for existing projects:")
+    emit("""
 When you select an existing project, you provide:
 
 1. PROJECT IDENTIFICATION:
@@ -44,46 +72,47 @@ Generates code that integrates seamlessly
 """)
 
     # Test 1: Analyze the test project 
-    print("\nSTEP 1: Analyzing the existing test project...")
+    emit("\nSTEP 1: Analyzing the existing test project...")
     
     try:
-        with open('test_existing_project.zip', 'rb') as f:
-            zip_content = f.read()
+        if existing_project_zip is None:
+            raise FileNotFoundError("test_existing_project.zip")
         
         project_files = await process_uploaded_zip(
-            zip_content, 
+            existing_project_zip.bytes, 
             "test_existing_project.zip",
             hints={"main_language": "auto-detect"}
         )
         
-        print(f"Analysis complete!")
-        print(f"   Files found: {project_files.total_files}")
-        print(f"   Total size: {project_files.total_size} bytes")
-        print(f"   Detected language: {project_files.detected_language}")
-        print(f"   Detected framework: {project_files.detected_framework}")
-        print(f"   Project structure:")
+        emit(f"Analysis complete!")
+        emit(f"   Files found: {project_files.total_files}")
+        emit(f"   Total size: {project_files.total_size} bytes")
+        emit(f"   Detected language: {project_files.detected_language}")
+        emit(f"   Detected framework: {project_files.detected_framework}")
+        emit(f"   Project structure:")
         
         structure = project_files.project_structure
         if structure:
-            print(f"      • Type: {structure.get('directories', 'N/A')}")
-            print(f"      • Has src directory: {structure.get('has_src_directory', False)}")
-            print(f"      • Has tests: {structure.get('has_test_directory', False)}")
-            print(f"      • Entry points: {structure.get('entry_points', [])}")
-            print(f"      • Config files: {structure.get('config_files', [])}")
+            emit(f"      • Type: {structure.get('directories', 'N/A')}")
+            emit(f"      • Has src directory: {structure.get('has_src_directory', False)}")
+            emit(f"      • Has tests: {structure.get('has_test_directory', False)}")
+            emit(f"      • Entry points: {structure.get('entry_points', [])}")
+            emit(f"      • Config files: {structure.get('config_files', [])}")
         
-        print("\nFiles in project:")
+        emit("\nFiles in project:")
         for file_path in sorted(project_files.files.keys())[:10]:  # Show first 10 files
-            print(f"      • {file_path}")
+            emit(f"      • {file_path}")
         if project_files.total_files > 10:
-            print(f"      ... and {project_files.total_files - 10} more files")
+            emit(f"      ... and {project_files.total_files - 10} more files")
             
     except Exception as e:
-        print(f"Error analyzing project: {e}")
+        emit(f"Error analyzing project: {e}")
+        sys.stdout.write("\n".join(lines) + "\n")
         return False
 
     # Test 2: Show example request scenarios
-    print("\n\nEXAMPLE SCENARIOS FOR EXISTING PROJECTS:")
-    print("=" * 60)
+    emit("\n\nEXAMPLE SCENARIOS FOR EXISTING PROJECTS:")
+    emit("=" * 60)
     
     scenarios = [
         {
@@ -137,49 +166,31 @@ Generates code that integrates seamlessly
     ]
     
     for i, scenario in enumerate(scenarios, 1):
-        print(f"\n{scenario['title']}")
-        print("-" * 40)
-        print(f"What you'd describe: {scenario['description']}")
-        print(f"Requirements you'd list:")
+        emit(f"\n{scenario['title']}")
+        emit("-" * 40)
+        emit(f"What you'd describe: {scenario['description']}")
+        emit(f"Requirements you'd list:")
         for req in scenario['requirements']:
-            print(f"   • {req}")
-        print(f"What the system does: {scenario['what_happens']}")
+            emit(f"   • {req}")
+        emit(f"What the system does: {scenario['what_happens']}")
         
     # Test 3: Show the actual API request format
-    print("\n\nTECHNICAL: What gets sent to the API")
-    print("=" * 60)
+    emit("\n\nTECHNICAL: What gets sent to the API")
+    emit("=" * 60)
     
-    example_request = {
-        "project_name": "MyApp Enhancement",
-        "description": "Add user authentication and API rate limiting to my existing FastAPI + React application",
-        "requirements": [
-            "JWT-based user authentication",
-            "User registration and login endpoints", 
-            "Protected API routes with middleware",
-            "React login/signup components",
-            "API rate limiting with Redis",
-            "Session management"
-        ],
-        "project_type": "existing_local",  # or "existing_git"
-        "priority": "high",
-        "technology_preferences": ["FastAPI", "React", "TypeScript", "Redis", "JWT"],
-        "main_language": "python",  # detected automatically
-        "framework": "fastapi"     # detected automatically
-    }
+    emit("Request payload:")
+    emit(EXAMPLE_REQUEST_JSON)
     
-    print("Request payload:")
-    print(json.dumps(example_request, indent=2))
-    
-    print("\nResponse includes:")
-    print("   • Request ID for tracking")
-    print("   • Analysis of existing codebase") 
-    print("   • Integration plan")
-    print("   • Generated code that fits existing patterns")
-    print("   • Updated files that enhance current functionality")
+    emit("\nResponse includes:")
+    emit("   • Request ID for tracking")
+    emit("   • Analysis of existing codebase") 
+    emit("   • Integration plan")
+    emit("   • Generated code that fits existing patterns")
+    emit("   • Updated files that enhance current functionality")
     
     # Test 4: Show the difference vs new projects
-    print("\n\nDIFFERENCE: Existing vs New Projects")
-    print("=" * 60)
+    emit("\n\nDIFFERENCE: Existing vs New Projects")
+    emit("=" * 60)
     
     comparison = """
 NEW PROJECT:
@@ -199,26 +210,35 @@ KEY DIFFERENCE: With existing projects, you describe CHANGES/ADDITIONS,
 not the entire project. The system respects and builds upon what you have.
 """
     
-    print(comparison)
+    emit(comparison)
     
-    print("\n\nREADY TO TEST!")
-    print("=" * 60)
-    print("To test existing project workflow:")
-    print("1. Start the API gateway: cd services/api-gateway && python main.py") 
-    print("2. Go to: http://localhost:8000/dashboard")
-    print("3. Select 'Local Project (Upload Files)' or 'Existing Git Repository'")
-    print("4. Upload the test_existing_project.zip or enter a Git URL")
-    print("5. In Description: 'Add user authentication system'")
-    print("6. In Requirements: 'JWT auth, login/signup pages, protected routes'")
-    print("7. Submit and watch the magic!")
+    emit("\n\nREADY TO TEST!")
+    emit("=" * 60)
+    emit("To test existing project workflow:")
+    emit("1. Start the API gateway: cd services/api-gateway && python main.py") 
+    emit("2. Go to: http://localhost:8000/dashboard")
+    emit("3. Select 'Local Project (Upload Files)' or 'Existing Git Repository'")
+    emit("4. Upload the test_existing_project.zip or enter a Git URL")
+    emit("5. In Description: 'Add user authentication system'")
+    emit("6. In Requirements: 'JWT auth, login/signup pages, protected routes'")
+    emit("7. Submit and watch the magic!")
     
+    sys.stdout.write("\n".join(lines) + "\n")
     return True
 
+@pytest.mark.asyncio
+async def test_existing_project_workflow(existing_project_zip):
+    """Existing project workflow runs end to end on the sample archive"""
+    if existing_project_zip is None:
+        pytest.skip("test_existing_project.zip not available")
+    assert await demo_existing_project_workflow(existing_project_zip)
+
 async def main():
     """Run the demonstration"""
+    from tests.project_samples import load_existing_project_zip
     print("Starting Existing Project Workflow Demo\n")
     
-    success = await demo_existing_project_workflow()
+    success = await demo_existing_project_workflow(load_existing_project_zip())
     
     if success:
         print("\nDemo completed! You now understand how existing projects work.")
@@ -4,118 +4,132 @@ Test script to verify file upload functionality
 """
 
 import asyncio
+import io
 import sys
 import tempfile
 import zipfile
 from pathlib import Path
 
-# Add project root to path
-sys.path.append('/home/flip/Desktop/test_swarm')
+import pytest
+
+if __name__ == "__main__":
+    # Run as a script, so pytest has not loaded conftest.py to set up the import roots
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    import tests.conftest  # noqa: F401
 
 from src.common.file_handler import FileHandler, process_uploaded_zip, process_git_repo
 
-async def test_file_handler():
+# Sample project archived by test_file_handler, keyed by path inside the ZIP
+SAMPLE_PROJECT_FILES = {
+    "main.py": """
+def main():
+    print("Hello, World!")
+
+if __name__ == "__main__":
+    main()
+""",
+    "requirements.txt": "fastapi>=0.110.0\nuvicorn>=0.24.0",
+    "README.md": "# Test Project\nThis is a test project.",
+    "src/__init__.py": "",
+    "src/utils.py": "def helper(): pass",
+}
+
+@pytest.mark.asyncio
+async def test_file_handler(tiny_git_repo):
     """Test the file handler with various scenarios"""
     print("Testing File Handler...")
     
     # Test 1: Create a simple ZIP file for testing
     print("\nTest 1: Creating test ZIP file...")
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        
-        # Create test project structure
-        project_dir = temp_path / "test_project"
-        project_dir.mkdir()
-        
-        # Create some test files
-        (project_dir / "main.py").write_text("""
-def main():
-    print("Hello, World!")
+    buffer = io.BytesIO()
+    # Tiny text files: storing is cheaper than running them through zlib
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zip_file:
+        for arcname, content in SAMPLE_PROJECT_FILES.items():
+            zip_file.writestr(arcname, content)
+    buffer.seek(0)
+    
+    print(f"Created test ZIP file: {buffer.getbuffer().nbytes} bytes")
+    
+    # Test 2: Process uploaded ZIP
+    print("\nTest 2: Processing uploaded ZIP...")
+    project_files = await process_uploaded_zip(
+        buffer, 
+        "test_project.zip",
+        hints={"main_language": "python"}
+    )
+    
+    print(f"Processed ZIP successfully!")
+    print(f"   - Files: {project_files.total_files}")
+    print(f"   - Size: {project_files.total_size} bytes")
+    print(f"   - Detected language: {project_files.detected_language}")
+    print(f"   - Detected framework: {project_files.detected_framework}")
+    print(f"   - Source type: {project_files.source_type}")
+    
+    # Print file list
+    print("   - Files found:")
+    for file_path in sorted(project_files.files.keys()):
+        print(f"     * {file_path}")
+    
+    assert project_files.source_type == "upload"
+    assert project_files.files == SAMPLE_PROJECT_FILES
+    assert project_files.total_files == len(SAMPLE_PROJECT_FILES)
+    assert project_files.total_size == sum(map(len, SAMPLE_PROJECT_FILES.values()))
+    assert project_files.detected_language == "python"
+    assert project_files.detected_framework == "fastapi"
+    
+    # Test 3: Test Git repo against a local bare repository (no network)
+    print("\nTest 3: Testing Git repository processing...")
+    git_project_files = await process_git_repo(
+        git_url=tiny_git_repo,
+        branch="master",
+        hints={"main_language": "auto-detect"}
+    )
+    
+    print(f"Processed Git repo successfully!")
+    print(f"   - Files: {git_project_files.total_files}")
+    print(f"   - Size: {git_project_files.total_size} bytes")
+    print(f"   - Detected language: {git_project_files.detected_language}")
+    print(f"   - Source type: {git_project_files.source_type}")
+    
+    assert git_project_files.source_type == "git"
+    assert git_project_files.total_files == 1
+    assert set(git_project_files.files) == {"README.md"}
+    
+    print("\nAll file handler tests completed successfully!")
 
-if __name__ == "__main__":
-    main()
-""")
-        
-        (project_dir / "requirements.txt").write_text("fastapi>=0.110.0\nuvicorn>=0.24.0")
-        
-        (project_dir / "README.md").write_text("# Test Project\nThis is a test project.")
-        
-        # Create sub-directory
-        src_dir = project_dir / "src"
-        src_dir.mkdir()
-        (src_dir / "__init__.py").write_text("")
-        (src_dir / "utils.py").write_text("def helper(): pass")
-        
-        # Create ZIP file
-        zip_path = temp_path / "test_project.zip"
-        with zipfile.ZipFile(zip_path, 'w') as zip_file:
-            for file_path in project_dir.rglob("*"):
-                if file_path.is_file():
-                    arcname = file_path.relative_to(project_dir)
-                    zip_file.write(file_path, arcname)
-        
-        # Read ZIP content
-        with open(zip_path, 'rb') as f:
-            zip_content = f.read()
-        
-        print(f"Created test ZIP file: {len(zip_content)} bytes")
-        
-        # Test 2: Process uploaded ZIP
-        print("\nTest 2: Processing uploaded ZIP...")
-        try:
-            project_files = await process_uploaded_zip(
-                zip_content, 
-                "test_project.zip",
-                hints={"main_language": "python"}
-            )
-            
-            print(f"Processed ZIP successfully!")
-            print(f"   - Files: {project_files.total_files}")
-            print(f"   - Size: {project_files.total_size} bytes")
-            print(f"   - Detected language: {project_files.detected_language}")
-            print(f"   - Detected framework: {project_files.detected_framework}")
-            print(f"   - Source type: {project_files.source_type}")
-            
-            # Print file list
-            print("   - Files found:")
-            for file_path in sorted(project_files.files.keys()):
-                print(f"     * {file_path}")
-                
-        except Exception as e:
-            print(f"Error processing ZIP: {e}")
-            return False
-        
-        # Test 3: Test Git repo (optional, requires network)
-        print("\nTest 3: Testing Git repository processing (optional)...")
-        try:
-            # Test with a small public repo
-            git_project_files = await process_git_repo(
-                git_url="https://github.com/octocat/Hello-World.git",
-                branch="master",
-                hints={"main_language": "auto-detect"}
-            )
-            
-            print(f"Processed Git repo successfully!")
-            print(f"   - Files: {git_project_files.total_files}")
-            print(f"   - Size: {git_project_files.total_size} bytes")
-            print(f"   - Detected language: {git_project_files.detected_language}")
-            print(f"   - Source type: {git_project_files.source_type}")
-            
-        except Exception as e:
-            print(f"Git test skipped (requires network): {e}")
-        
-        print("\nAll file handler tests completed successfully!")
-        return True
+@pytest.mark.asyncio
+async def test_zip_upload_matches_extracted_text_files():
+    """Uploaded members read like files extracted to disk and opened in text mode"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w') as zip_file:
+        zip_file.writestr("crlf.py", b"a = 1\r\nb = 2\r\n")
+        zip_file.writestr("./b.py", "print('b')\n")
+        zip_file.writestr("src/../c.py", "c = 3\r")
+    buffer.seek(0)
+    
+    project_files = await process_uploaded_zip(buffer, "newlines.zip")
+    
+    expected = {
+        "crlf.py": "a = 1\nb = 2\n",
+        "b.py": "print('b')\n",
+        "src/c.py": "c = 3\n",
+    }
+    assert project_files.files == expected
+    assert project_files.total_size == sum(map(len, expected.values()))
 
 async def test_api_imports():
     """Test that all API components can be imported"""
     print("\nTesting API imports...")
     
     try:
-        # Test API gateway imports
-        sys.path.append('/home/flip/Desktop/test_swarm/services/api-gateway')
-        import main as api_main
+        # Test API gateway imports; loaded by path since the analysis agent's
+        # main module is already importable as `main`
+        import importlib.util
+        gateway_main = Path(__file__).resolve().parents[1] / "services" / "api-gateway" / "main.py"
+        spec = importlib.util.spec_from_file_location("api_gateway_main", gateway_main)
+        api_main = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(api_main)
         print("API Gateway imports successfully")
         
         # Test file handler integration
@@ -142,7 +156,13 @@ async def main():
     success &= await test_api_imports()
     
     # Test file handler
-    success &= await test_file_handler()
+    from tests.project_samples import make_tiny_git_repo
+    with tempfile.TemporaryDirectory() as temp_dir:
+        try:
+            await test_file_handler(make_tiny_git_repo(Path(temp_dir)))
+        except Exception as e:
+            print(f"File handler test failed: {e!r}")
+            success = False
     
     if success:
         print("\nAll tests passed! File upload functionality is ready.")
@@ -4,16 +4,42 @@ Test script for MCP-enhanced Analysis Agent
 Shows how the enhanced orchestrator works with existing projects
 """
 
+import contextlib
 import os
-import sys
 import json
+import itertools
 import logging
+import sys
 from pathlib import Path
+from types import MappingProxyType
+
+if __name__ == "__main__":
+    # Run as a script, so pytest has not loaded conftest.py to set up the import roots
+    sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+    import tests.conftest  # noqa: F401
 
-# Add src to path for imports
-sys.path.append(str(Path(__file__).parent / "src"))
+from src.analysis_agent.orchestrator import Orchestrator
 
-from analysis_agent.orchestrator import Orchestrator
+# Shared read-only default for metadata lookups
+_EMPTY = MappingProxyType({})
+
+SOURCE_SUFFIXES = (".py", ".js", ".jsx", ".ts", ".tsx")
+
+def _iter_source_files(root):
+    """Yield source file paths under root in one scandir walk, without following symlinks"""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(SOURCE_SUFFIXES) and entry.is_file(follow_symlinks=False):
+                    yield entry.path
 
 def main():
     """Test the MCP-enhanced Analysis Agent"""
@@ -50,13 +76,13 @@ def main():
     print("-" * 40)
     
     # Use generated_project as example existing codebase
-    project_files = []
     generated_project_path = Path("generated_project")
     
     if generated_project_path.exists():
-        # Collect Python and JavaScript files
-        for ext in ["*.py", "*.js", "*.jsx", "*.ts", "*.tsx"]:
-            project_files.extend(str(f) for f in generated_project_path.rglob(ext))
+        # Collect the first 10 Python and JavaScript files; closing the generator
+        # releases the open scandir handles as soon as the 10th file is found
+        with contextlib.closing(_iter_source_files(str(generated_project_path))) as source_files:
+            project_files = list(itertools.islice(source_files, 10))
         
         if project_files:
             existing_project_requirement = """
@@ -68,13 +94,13 @@ def main():
             try:
                 tasks = orchestrator.run(
                     existing_project_requirement, 
-                    project_files=project_files[:10],  # Limit to first 10 files
+                    project_files=project_files,
                     project_type="existing"
                 )
                 print(f"Generated {len(tasks)} MCP-enhanced tasks for existing project")
                 for i, task in enumerate(tasks[:3], 1):
                     print(f"   {i}. {task.get('title', 'Untitled task')}")
-                    metadata = task.get('metadata', {})
+                    metadata = task.get('metadata', _EMPTY)
                     if metadata.get('project_type') == 'existing':
                         print(f"      Analyzed {metadata.get('total_existing_files', 0)} existing files")
                         
@@ -90,14 +116,13 @@ def main():
     print("\nTest 3: Fallback Behavior")
     print("-" * 40)
     
-    # Test with MCP disabled
-    orchestrator_no_mcp = Orchestrator(enable_mcp=False)
-    
+    # Test with MCP disabled, reusing the same orchestrator
     try:
-        tasks = orchestrator_no_mcp.run(
+        tasks = orchestrator.run(
             "Add a search feature to this app",
             project_files=["app.py", "main.js"],
-            project_type="existing"
+            project_type="existing",
+            enable_mcp=False
         )
         print(f"Fallback to standard analysis worked: {len(tasks)} tasks")
     except Exception as e:
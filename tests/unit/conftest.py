@@ -0,0 +1,34 @@
+"""Shared fixtures for the unit tests."""
+
+from types import SimpleNamespace
+
+import openai
+import pytest
+
+
+@pytest.fixture
+def openai_stub(request, monkeypatch):
+    """
+    Replace openai.OpenAI with a fake client whose chat.completions.create
+    dispatches to a shared state dict.
+
+    The prompt steps build ``OpenAI()`` and call ``client.chat.completions.create``
+    on every run, so patching the class intercepts each call. Tests set
+    ``openai_stub["response"]`` to the object the stub should return (or an
+    exception instance for it to raise) and can inspect the keyword arguments
+    of each call in ``openai_stub["calls"]``. When parametrized with
+    ``indirect=True`` the parameter is used as the initial response.
+    """
+    state = {"response": getattr(request, "param", None), "calls": []}
+
+    def create(*args, **kwargs):
+        state["calls"].append(kwargs)
+        if isinstance(state["response"], BaseException):
+            raise state["response"]
+        return state["response"]
+
+    def fake_client(*args, **kwargs):
+        return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+    monkeypatch.setattr(openai, "OpenAI", fake_client)
+    return state
@@ -1,7 +1,7 @@
+import os
 import pytest
 from pathlib import Path
 from types import SimpleNamespace
-import openai
 from analysis_agent.prompt_steps.intent_extraction import run, IntentExtractionError
 
 class DummyChoice:
@@ -10,34 +10,42 @@ class DummyChoice:
 
 class DummyResponse:
     def __init__(self, content):
-        self.choices = [DummyChoice(content)]
+        self.choices = (DummyChoice(content),)
 
-def test_run_success(monkeypatch, tmp_path):
+_RESP_INVALID = DummyResponse("not a json")
+_RESP_MISSING = DummyResponse('{"no_intent":"oops"}')
+
+def test_run_success(openai_stub, tmp_path):
     templates_dir = tmp_path
     template_file = templates_dir / "01_intent_extraction.jinja2"
     template_file.write_text("Extract intent from: {{ text }}")
-    def fake_create(model, messages, temperature):
-        assert isinstance(model, str)
-        assert messages[-1]["content"] == "Extract intent from: hello world"
-        return DummyResponse('{"intent": "greet"}')
-    monkeypatch.setattr(openai.ChatCompletion, "create", staticmethod(fake_create))
+    openai_stub["response"] = DummyResponse('{"intent": "greet"}')
     result = run({"text": "hello world"}, templates_dir)
     assert result == {"intent": "greet"}
+    call = openai_stub["calls"][-1]
+    assert isinstance(call["model"], str)
+    assert call["messages"][-1]["content"] == "Extract intent from: hello world"
 
-def test_run_invalid_json(monkeypatch, tmp_path):
-    templates_dir = tmp_path
-    (templates_dir / "01_intent_extraction.jinja2").write_text("dummy template")
-    monkeypatch.setattr(openai.ChatCompletion, "create", staticmethod(lambda *args, **kwargs: DummyResponse("not a json")))
-    with pytest.raises(IntentExtractionError):
-        run({}, templates_dir)
-
-def test_run_missing_intent_key(monkeypatch, tmp_path):
-    templates_dir = tmp_path
-    (templates_dir / "01_intent_extraction.jinja2").write_text("dummy")
-    monkeypatch.setattr(openai.ChatCompletion, "create", staticmethod(lambda *args, **kwargs: DummyResponse('{"no_intent":"oops"}')))
+@pytest.mark.parametrize("response", [_RESP_INVALID, _RESP_MISSING], ids=["invalid-json", "missing-key"])
+def test_run_bad_response(openai_stub, tmp_path, response):
+    (tmp_path / "01_intent_extraction.jinja2").write_text("dummy")
+    openai_stub["response"] = response
     with pytest.raises(IntentExtractionError):
-        run({}, templates_dir)
+        run({}, tmp_path)
+    assert len(openai_stub["calls"]) == 1
 
 def test_missing_template_file(tmp_path):
     with pytest.raises(FileNotFoundError):
-        run({"text": "anything"}, tmp_path)
\ No newline at end of file
+        run({"text": "anything"}, tmp_path)
+
+def test_template_cached_until_modified(tmp_path):
+    from analysis_agent.prompt_steps.intent_extraction import _load_template, TEMPLATE_NAME
+    template_file = tmp_path / TEMPLATE_NAME
+    template_file.write_text("v1 {{ text }}")
+    mtime = template_file.stat().st_mtime_ns
+    first = _load_template(str(tmp_path), mtime)
+    assert _load_template(str(tmp_path), mtime) is first
+    template_file.write_text("v2 {{ text }}")
+    os.utime(template_file, ns=(mtime + 1_000_000, mtime + 1_000_000))
+    reloaded = _load_template(str(tmp_path), template_file.stat().st_mtime_ns)
+    assert reloaded.render(text="x") == "v2 x"
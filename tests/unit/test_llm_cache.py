@@ -0,0 +1,85 @@
+import pytest
+
+from utils.llm_cache import cached_llm_call, input_key
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+def _step(calls, maxsize):
+    @cached_llm_call(maxsize=maxsize)
+    def call_llm(validated_input):
+        calls.append(validated_input)
+        return {"echo": validated_input}
+    return call_llm
+
+
+def test_hit_returns_the_stored_result_without_a_call(calls):
+    call_llm = _step(calls, maxsize=4)
+    first = call_llm({"requirement": "login"})
+    assert call_llm({"requirement": "login"}) is first
+    assert len(calls) == 1
+
+
+def test_miss_calls_through(calls):
+    call_llm = _step(calls, maxsize=4)
+    call_llm({"requirement": "login"})
+    call_llm({"requirement": "logout"})
+    assert calls == [{"requirement": "login"}, {"requirement": "logout"}]
+
+
+def test_key_is_stable_under_dict_reordering(calls):
+    a = {"requirement": "login", "context": {"lang": "python", "framework": "fastapi"}}
+    b = {"context": {"framework": "fastapi", "lang": "python"}, "requirement": "login"}
+    assert input_key(a) == input_key(b)
+    call_llm = _step(calls, maxsize=4)
+    call_llm(a)
+    call_llm(b)
+    assert len(calls) == 1
+
+
+def test_least_recently_used_entry_is_evicted(calls):
+    call_llm = _step(calls, maxsize=2)
+    call_llm({"n": 1})
+    call_llm({"n": 2})
+    call_llm({"n": 1})  # hit, so {"n": 2} is now the oldest
+    call_llm({"n": 3})  # evicts {"n": 2}
+    assert len(calls) == 3
+    call_llm({"n": 1})
+    call_llm({"n": 3})
+    assert len(calls) == 3
+    call_llm({"n": 2})
+    assert calls[-1] == {"n": 2}
+    assert len(calls) == 4
+
+
+def test_failures_are_not_cached():
+    attempts = []
+
+    @cached_llm_call(maxsize=4)
+    def call_llm(validated_input):
+        attempts.append(validated_input)
+        if len(attempts) == 1:
+            raise RuntimeError("LLM down")
+        return "ok"
+
+    with pytest.raises(RuntimeError):
+        call_llm({"n": 1})
+    assert call_llm({"n": 1}) == "ok"
+    assert len(attempts) == 2
+
+
+def test_cache_clear_and_disabled_cache(calls):
+    call_llm = _step(calls, maxsize=4)
+    call_llm({"n": 1})
+    call_llm.cache_clear()
+    call_llm({"n": 1})
+    assert len(calls) == 2
+
+    disabled = _step(calls, maxsize=0)
+    assert not hasattr(disabled, "cache_clear")
+    disabled({"n": 1})
+    disabled({"n": 1})
+    assert len(calls) == 4
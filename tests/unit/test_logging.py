@@ -0,0 +1,48 @@
+import io
+import json
+import logging
+
+import pytest
+
+from utils import logging as afk_logging
+
+
+@pytest.fixture(params=[None, "%Y-%m-%dT%H:%M:%S"], ids=["default-datefmt", "custom-datefmt"])
+def json_logger(request, monkeypatch):
+    """A logger writing JSON lines to a buffer, installed as the module logger"""
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(afk_logging.JsonFormatter(datefmt=request.param))
+    handler.addFilter(afk_logging.RequestIdFilter())
+    # A standalone logger, so pytest's capture handlers are not attached to it
+    logger = logging.Logger("test_logging", logging.INFO)
+    logger.propagate = False
+    logger.addHandler(handler)
+    monkeypatch.setattr(afk_logging, "logger", logger)
+    return logger, stream
+
+
+def _timestamp_shape(timestamp):
+    return "".join("9" if c.isdigit() else c for c in timestamp)
+
+
+def test_metric_lines_match_log_lines(json_logger):
+    logger, stream = json_logger
+    afk_logging.set_request_id("req-1")
+    try:
+        logger.info("hello")
+        afk_logging.log_metric("latency", 1.5, {"step": "intent"})
+    finally:
+        afk_logging.clear_request_id()
+
+    log_line, metric_line = map(json.loads, stream.getvalue().splitlines())
+    metric_record = metric_line.pop("metric_record")
+    assert metric_record["metric"] == "latency"
+    assert metric_record["tags"] == {"step": "intent"}
+    assert metric_record["request_id"] == "req-1"
+    assert metric_line.keys() == log_line.keys()
+    assert _timestamp_shape(metric_line["timestamp"]) == _timestamp_shape(log_line["timestamp"])
+    assert metric_line["request_id"] == log_line["request_id"] == "req-1"
+    assert metric_line["module"] == log_line["module"] == "test_logging"
+    assert metric_line["funcName"] == log_line["funcName"] == "test_metric_lines_match_log_lines"
+    assert metric_line["lineNo"] == log_line["lineNo"] + 1
@@ -0,0 +1,26 @@
+from utils.prompt_cache import EPHEMERAL_CACHE, build_messages
+
+
+def test_system_prompt_is_the_cacheable_prefix():
+    messages = build_messages("You are a planner.", "Plan the login page")
+    assert [m["role"] for m in messages] == ["system", "user"]
+    system_block, = messages[0]["content"]
+    assert system_block == {
+        "type": "text",
+        "text": "You are a planner.",
+        "cache_control": {"type": "ephemeral"},
+    }
+    assert system_block["cache_control"] == EPHEMERAL_CACHE
+
+
+def test_user_prompt_carries_no_cache_marker():
+    messages = build_messages("static", "dynamic")
+    # plain string content, so the marker on the system block ends the cached prefix
+    assert messages[1] == {"role": "user", "content": "dynamic"}
+
+
+def test_system_prefix_is_identical_across_user_prompts():
+    first = build_messages("static", "one")
+    second = build_messages("static", "two")
+    assert first[0] == second[0]
+    assert first[1] != second[1]
@@ -1,46 +1,46 @@
 import pytest
 import json
+from dataclasses import dataclass
 from pathlib import Path
 import analysis_agent.prompt_steps.requirement_decomposition as rd
 
+@dataclass(slots=True)
+class _Msg:
+    content: str
+
+@dataclass(slots=True)
 class DummyChoice:
-    def __init__(self, content):
-        self.message = type("Message", (), {"content": content})
+    message: _Msg
 
+@dataclass(slots=True)
 class DummyResponse:
-    def __init__(self, content):
-        self.choices = [DummyChoice(content)]
+    choices: list
 
-def test_run_success(tmp_path, monkeypatch):
-    input_data = {"requirement": "Implement login"}
-    templates_dir = tmp_path / "prompts"
-    templates_dir.mkdir()
-    (templates_dir / "02_requirement_decomposition.jinja2").write_text("Prompt: {{ input.requirement }}")
-    expected_output = {"decomposed_requirements": ["User must be authenticated"]}
-    def fake_create(*args, **kwargs):
-        return DummyResponse(json.dumps(expected_output))
-    monkeypatch.setattr(rd.openai.ChatCompletion, "create", fake_create)
-    result = rd.run(input_data, templates_dir)
-    assert result == expected_output
+def _response(content):
+    return DummyResponse([DummyChoice(_Msg(content))])
 
-def test_run_invalid_json(tmp_path, monkeypatch):
-    input_data = {"requirement": "Implement login"}
-    templates_dir = tmp_path / "prompts"
-    templates_dir.mkdir()
-    (templates_dir / "02_requirement_decomposition.jinja2").write_text("Prompt: {{ input.requirement }}")
-    def fake_create(*args, **kwargs):
-        return DummyResponse("not a json")
-    monkeypatch.setattr(rd.openai.ChatCompletion, "create", fake_create)
-    with pytest.raises(ValueError):
-        rd.run(input_data, templates_dir)
+@pytest.fixture(scope="module")
+def templates_dir(tmp_path_factory):
+    """Prompt directory shared by every test in this module (tests only read it)"""
+    d = tmp_path_factory.mktemp("prompts")
+    (d / "02_requirement_decomposition.jinja2").write_text("Prompt: {{ requirement }}")
+    return d
 
-def test_run_llm_error(tmp_path, monkeypatch):
-    input_data = {}
-    templates_dir = tmp_path / "prompts"
-    templates_dir.mkdir()
-    (templates_dir / "02_requirement_decomposition.jinja2").write_text("Template content")
-    def fake_create(*args, **kwargs):
-        raise RuntimeError("API failure")
-    monkeypatch.setattr(rd.openai.ChatCompletion, "create", fake_create)
-    with pytest.raises(RuntimeError):
-        rd.run(input_data, templates_dir)
\ No newline at end of file
+EXPECTED_OUTPUT = {"decomposed_requirements": ["User must be authenticated"]}
+
+@pytest.mark.slow
+@pytest.mark.parametrize("openai_stub,expected,cause", [
+    (_response(json.dumps(EXPECTED_OUTPUT)), EXPECTED_OUTPUT, None),
+    (_response("not a json"), rd.PromptError, json.JSONDecodeError),
+    (RuntimeError("API failure"), rd.PromptError, RuntimeError),
+], indirect=["openai_stub"], ids=["success", "invalid-json", "llm-error"])
+def test_run(templates_dir, openai_stub, expected, cause):
+    input_data = {"requirement": "Implement login"}
+    if cause is not None:
+        with pytest.raises(expected) as excinfo:
+            rd.run(input_data, templates_dir)
+        assert isinstance(excinfo.value.__cause__, cause)
+    else:
+        assert rd.run(input_data, templates_dir) == expected
+    call, = openai_stub["calls"]
+    assert call["messages"][-1]["content"] == "Prompt: Implement login"
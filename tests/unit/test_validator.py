@@ -1,10 +1,12 @@
 import pytest
-from jsonschema import ValidationError, Draft7Validator
+from jsonschema import Draft7Validator
 import analysis_agent.utils.validator as validator
+from analysis_agent.utils.validator import ValidationError
 
-@pytest.fixture(autouse=True)
-def patch_schemas(monkeypatch):
-    schema_name = "person"
+SCHEMA_NAME = "person"
+
+@pytest.fixture(scope="module")
+def person_validator():
     schema = {
         "type": "object",
         "required": ["name", "age"],
@@ -14,37 +16,31 @@ def patch_schemas(monkeypatch):
         },
         "additionalProperties": False
     }
-    v = Draft7Validator(schema)
-    # Patch validator's internal registry for schemas
-    monkeypatch.setattr(validator, "_VALIDATORS", {schema_name: v}, raising=False)
-    monkeypatch.setattr(validator, "_SCHEMA_VALIDATORS", {schema_name: v}, raising=False)
-    return schema_name
+    return Draft7Validator(schema)
+
+@pytest.fixture
+def patch_schemas(monkeypatch, person_validator):
+    # Patch the registry validate() looks schemas up in
+    monkeypatch.setitem(validator._schemas, SCHEMA_NAME, person_validator)
+    return SCHEMA_NAME
 
 def test_validate_success(patch_schemas):
     data = {"name": "Alice", "age": 30}
     # Should not raise any exception
     validator.validate(data, patch_schemas)
 
-def test_validate_missing_required_field(patch_schemas):
-    data = {"name": "Alice"}
-    with pytest.raises(ValidationError) as excinfo:
-        validator.validate(data, patch_schemas)
-    assert "age" in str(excinfo.value)
-
-def test_validate_wrong_type(patch_schemas):
-    data = {"name": "Alice", "age": "30"}
+@pytest.mark.parametrize("data,needle", [
+    ({"name": "Alice"}, "age"),
+    ({"name": "Alice", "age": "30"}, "is not of type 'integer'"),
+    ({"name": "Alice", "age": 30, "extra": "value"}, "Additional properties are not allowed"),
+], ids=["missing-required-field", "wrong-type", "additional-property"])
+def test_validate_failures(patch_schemas, data, needle):
     with pytest.raises(ValidationError) as excinfo:
         validator.validate(data, patch_schemas)
-    msg = str(excinfo.value)
-    assert "is not of type 'integer'" in msg or "type" in msg
-
-def test_validate_additional_property(patch_schemas):
-    data = {"name": "Alice", "age": 30, "extra": "value"}
-    with pytest.raises(ValidationError) as excinfo:
-        validator.validate(data, patch_schemas)
-    assert "additionalProperties" in str(excinfo.value)
+    assert needle in str(excinfo.value)
 
 def test_validate_schema_not_found():
     data = {"foo": "bar"}
-    with pytest.raises(KeyError):
-        validator.validate(data, "nonexistent_schema")
\ No newline at end of file
+    with pytest.raises(ValidationError) as excinfo:
+        validator.validate(data, "nonexistent_schema")
+    assert "Schema 'nonexistent_schema' not found" in str(excinfo.value)
\ No newline at end of file
@@ -0,0 +1,216 @@
+import json
+import mmap
+
+import pytest
+from jsonschema import Draft7Validator
+
+import validators.validate as vv
+from validators.models import IntentData, Task
+from validators.validate import ValidationError, validate, validate_json, validate_many
+
+TASK = {"id": "t1", "title": "Login", "description": "Add a login page"}
+# Accepted by the Task model, rejected by task.schema.json (priority is an
+# integer there and estimated_time is not a schema property)
+MODEL_ONLY_TASK = dict(TASK, priority="high", estimated_time=2.0)
+INTENT = {
+    "intent": "Add user login",
+    "entities": [
+        {"name": "feature", "value": "login"},
+        {"name": "max_attempts", "value": 3},
+        {"name": "remember_me", "value": True},
+        {"name": "providers", "value": ["github", "google"]},
+    ],
+    "confidence": 0.9,
+}
+
+
+@pytest.fixture
+def schema_files(monkeypatch):
+    """Register extra schema files for one test and drop cached validators afterwards"""
+    files = dict(vv._SCHEMA_FILES)
+    monkeypatch.setattr(vv, "_SCHEMA_FILES", files)
+    vv._get_validator.cache_clear()
+    yield files
+    vv._get_validator.cache_clear()
+
+
+def _types(errors):
+    return [(e["type"], e.get("validator") or e.get("type_detail")) for e in errors]
+
+
+def test_model_only_path_skips_the_json_schema():
+    task = validate("task", MODEL_ONLY_TASK, strict_jsonschema=False)
+    assert isinstance(task, Task)
+    assert task.priority == "high"
+
+
+def test_model_only_path_enforces_the_ported_schema_rules():
+    with pytest.raises(ValidationError) as excinfo:
+        validate("task", {"id": "a b", "title": "", "description": "d", "status": "done"}, strict_jsonschema=False)
+    assert [e["loc"] for e in excinfo.value.errors] == [("id",), ("title",), ("status",)]
+
+
+@pytest.mark.parametrize("field", ["status", "created_at", "due_date", "metadata"])
+def test_optional_fields_may_be_omitted_but_not_null(field):
+    assert getattr(validate("task", TASK), field) is None
+    with pytest.raises(ValidationError) as excinfo:
+        validate("task", dict(TASK, **{field: None}))
+    assert [e["loc"] for e in excinfo.value.errors] == [(field,)]
+
+
+@pytest.mark.parametrize("strict", [False, True], ids=["model-only", "strict"])
+@pytest.mark.parametrize("data", [INTENT, {"intent": "Add user login"}], ids=["full", "minimal"])
+def test_schema_valid_intent_passes_both_passes(data, strict):
+    assert Draft7Validator(vv._load_json_schema("intent")).is_valid(data)
+    intent = validate("intent", data, strict_jsonschema=strict)
+    assert isinstance(intent, IntentData)
+    assert intent.model_dump(exclude_unset=True) == data
+
+
+@pytest.mark.parametrize("data,loc", [
+    ({"intent": ""}, ("intent",)),
+    ({"user_intent": "login", "intent": "login"}, ("user_intent",)),
+    ({"intent": "login", "confidence": 1.5}, ("confidence",)),
+    ({"intent": "login", "confidence": None}, ("confidence",)),
+    ({"intent": "login", "entities": [{"name": "a"}]}, ("entities", 0, "value")),
+    ({"intent": "login", "entities": [{"name": "a", "value": 1, "kind": "x"}]}, ("entities", 0, "kind")),
+], ids=["empty-intent", "extra-key", "confidence-range", "null-confidence", "entity-missing-value", "entity-extra-key"])
+def test_model_rejects_what_the_intent_schema_rejects(data, loc):
+    assert not Draft7Validator(vv._load_json_schema("intent")).is_valid(data)
+    with pytest.raises(ValidationError) as excinfo:
+        validate("intent", data)
+    assert excinfo.value.errors[0]["loc"] == loc
+
+
+def test_default_path_runs_the_json_schema():
+    assert validate("task", TASK) == Task(**TASK)
+    with pytest.raises(ValidationError) as excinfo:
+        validate("task", MODEL_ONLY_TASK)
+    assert _types(excinfo.value.errors) == [("jsonschema", "additionalProperties")]
+
+
+@pytest.mark.parametrize("strict,accepted", [(True, [True, False]), (False, [True, True])], ids=["default", "model-only"])
+def test_validate_many_enforces_the_schema_by_default(strict, accepted):
+    results = validate_many("task", [TASK, MODEL_ONLY_TASK], strict_jsonschema=strict)
+    assert [error is None for _, error in results] == accepted
+
+
+def test_fail_fast_off_reports_every_schema_error():
+    with pytest.raises(ValidationError) as excinfo:
+        validate("task", MODEL_ONLY_TASK, strict_jsonschema=True, fail_fast=False)
+    assert sorted(_types(excinfo.value.errors)) == [
+        ("jsonschema", "additionalProperties"),
+        ("jsonschema", "type"),
+    ]
+
+
+@pytest.mark.parametrize("fail_fast,expected", [
+    (True, [("pydantic", "missing")]),
+    (False, [("pydantic", "missing"), ("jsonschema", "required")]),
+], ids=["fail-fast", "all-errors"])
+def test_fail_fast_skips_schema_after_model_errors(fail_fast, expected):
+    data = {"id": "t1", "title": "Login"}
+    with pytest.raises(ValidationError) as excinfo:
+        validate("task", data, strict_jsonschema=True, fail_fast=fail_fast)
+    assert _types(excinfo.value.errors) == expected
+
+
+@pytest.mark.parametrize("data", [
+    {"title": "t", "description": "d"},
+    {"id": "t1", "description": "d"},
+    dict(TASK, extra=1),
+    dict(TASK, extra=1, other=2),
+], ids=["missing-first", "missing-second", "one-extra", "two-extras"])
+def test_key_fast_path_matches_jsonschema(data):
+    schema = vv._load_json_schema("task")
+    expected = next(Draft7Validator(schema).iter_errors(data))
+    error, = vv._get_validator("task")(data)
+    assert error == {
+        "type": "jsonschema",
+        "message": expected.message,
+        "validator": expected.validator,
+        "path": list(expected.path),
+    }
+
+
+def test_validate_many_keeps_order_and_pairs_errors():
+    items = [TASK, {"id": "t2"}, 5, dict(TASK, id="t3")]
+    results = validate_many("task", items)
+    assert [model is None for model, _ in results] == [False, True, True, False]
+    assert [error is None for _, error in results] == [True, False, False, True]
+    assert [model.id for model, _ in results if model is not None] == ["t1", "t3"]
+    assert isinstance(results[1][1], ValidationError)
+    assert _types(results[2][1].errors) == [("pydantic", "model_type")]
+
+
+def test_validate_many_unknown_schema_raises():
+    with pytest.raises(ImportError):
+        validate_many("nope", [TASK])
+
+
+@pytest.mark.parametrize("strict", [False, True], ids=["model-only", "strict"])
+def test_validate_json(strict):
+    assert validate_json("task", json.dumps(TASK).encode(), strict_jsonschema=strict) == Task(**TASK)
+
+    with pytest.raises(ValidationError) as excinfo:
+        validate_json("task", b"{not json", strict_jsonschema=strict)
+    assert _types(excinfo.value.errors) == [("pydantic", "json_invalid")]
+
+    with pytest.raises(ValidationError) as excinfo:
+        validate_json("task", "[1, 2]", strict_jsonschema=strict)
+    assert _types(excinfo.value.errors) == [("pydantic", "model_type")]
+
+
+def test_missing_schema_skips_the_schema_pass(schema_files):
+    del schema_files["task"]
+    assert validate("task", MODEL_ONLY_TASK, strict_jsonschema=True).id == "t1"
+
+
+@pytest.mark.skipif(vv.orjson is None, reason="the mmap branch needs orjson")
+def test_large_schema_is_parsed_from_a_memory_map(tmp_path, monkeypatch, schema_files):
+    schema = {
+        "type": "object",
+        "required": ["id"],
+        "description": "x" * vv.MMAP_THRESHOLD,
+    }
+    path = tmp_path / "big.schema.json"
+    path.write_text(json.dumps(schema))
+    schema_files["big"] = path
+
+    mapped = []
+    real_mmap = mmap.mmap
+
+    def spy(*args, **kwargs):
+        mapped.append(args)
+        return real_mmap(*args, **kwargs)
+
+    monkeypatch.setattr(vv.mmap, "mmap", spy)
+    assert vv._load_json_schema("big") == schema
+    assert len(mapped) == 1
+    assert vv._get_validator("big")({})[0]["message"] == "'id' is a required property"
+
+
+@pytest.fixture(params=["fastjsonschema", "jsonschema"])
+def schema_backend(request, monkeypatch):
+    """Run a test against the fastjsonschema code path and the jsonschema fallback"""
+    if request.param == "fastjsonschema":
+        pytest.importorskip("fastjsonschema")
+    else:
+        monkeypatch.setattr(vv, "fastjsonschema", None)
+    vv._get_validator.cache_clear()
+    yield request.param
+    vv._get_validator.cache_clear()
+
+
+def test_backends_ignore_format(schema_backend):
+    # Draft7Validator treats "format" as an annotation; both backends must agree
+    data = dict(TASK, created_at="yesterday", due_date="soon")
+    assert vv._get_validator("task")(data) == []
+    assert validate("task", data, strict_jsonschema=True).due_date == "soon"
+
+
+def test_backends_report_the_same_error_shape(schema_backend):
+    error, = vv._get_validator("task")(dict(TASK, dependencies=["a", 1]))
+    assert error["type"] == "jsonschema"
+    assert error["validator"] == "type"
+    assert error["path"] == ["dependencies", 1]
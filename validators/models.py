@@ -1,18 +1,62 @@
-from pydantic import BaseModel, Field
-from typing import List, Optional, Literal, Type, Dict
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictFloat, StrictInt, StrictStr, field_validator
+from typing import Any, List, Optional, Literal, Type, Dict, Union
+
+def _reject_null(v: Any) -> Any:
+    # The schemas let optional keys be omitted but not set to null
+    if v is None:
+        raise ValueError("may be omitted but not null")
+    return v
+
+class Entity(BaseModel):
+    """An entity recognised in the requirement, as in schemas/intent.schema.json."""
+    name: str = Field(..., min_length=1, description="The type or name of the entity")
+    value: Union[StrictStr, StrictInt, StrictFloat, StrictBool, Dict[str, Any], List[Any]] = Field(
+        ..., description="The value of the extracted entity"
+    )
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 class IntentData(BaseModel):
-    user_intent: str = Field(..., description="Extracted intent from raw requirement")
-    domain: Optional[str] = Field(None, description="Optional domain of the intent")
-    confidence: float = Field(..., ge=0.0, le=1.0, description="Confidence score for intent extraction")
+    """Intent extraction output, ported from schemas/intent.schema.json."""
+    intent: str = Field(..., min_length=1, description="High-level intent derived from the user input")
+    entities: List[Entity] = Field(default_factory=list, description="List of recognized entities")
+    confidence: Optional[float] = Field(None, ge=0.0, le=1.0, description="Confidence score for intent extraction")
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    _not_null = field_validator("confidence", mode="before")(_reject_null)
 
 class Task(BaseModel):
-    id: str = Field(..., description="Unique identifier for the task")
-    title: str = Field(..., description="Title of the task")
-    description: str = Field(..., description="Detailed description of the task")
+    """
+    Task record, mirroring the constraints in schemas/task.schema.json.
+
+    Two fields still differ from the schema: priority is a low/medium/high label
+    here but an integer 1-5 there, and estimated_time exists only here. The date
+    fields are kept as strings, as in the schema. Optional fields other than
+    assignee may be omitted but, as in the schema, not set to null.
+    """
+    id: str = Field(..., pattern=r"^[A-Za-z0-9_-]+$", description="Unique identifier for the task")
+    title: str = Field(..., min_length=1, description="Title of the task")
+    description: str = Field(..., min_length=1, description="Detailed description of the task")
     dependencies: List[str] = Field(default_factory=list, description="IDs of tasks this task depends on")
     estimated_time: Optional[float] = Field(None, gt=0.0, description="Estimated time to complete the task in hours")
     priority: Literal["low", "medium", "high"] = Field("medium", description="Priority level of the task")
+    status: Optional[Literal["pending", "in_progress", "completed"]] = Field(None, description="Current status of the task")
+    assignee: Optional[str] = Field(None, description="Identifier of the assignee responsible for this task")
+    created_at: Optional[str] = Field(None, description="ISO 8601 timestamp when the task was created")
+    due_date: Optional[str] = Field(None, description="Due date for the task in YYYY-MM-DD format")
+    metadata: Optional[Dict[str, Any]] = Field(None, description="Arbitrary metadata for extensibility")
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    _not_null = field_validator("status", "created_at", "due_date", "metadata", mode="before")(_reject_null)
+
+    @field_validator("dependencies")
+    @classmethod
+    def _unique_dependencies(cls, v):
+        if len(set(v)) != len(v):
+            raise ValueError("dependencies must not contain duplicate task IDs")
+        return v
 
 MODEL_MAP: Dict[str, Type[BaseModel]] = {
     "intent": IntentData,
@@ -1,13 +1,38 @@
 from pathlib import Path
+import functools
 import json
-import importlib
-from typing import Any, Type
-from jsonschema import validate as jsonschema_validate, ValidationError as JsonSchemaValidationError
+import mmap
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Type, Union
+from jsonschema import Draft7Validator
+from jsonschema.exceptions import ValidationError as JsonSchemaValidationError
+from jsonschema.validators import validator_for
 from pydantic import BaseModel, ValidationError as PydanticValidationError
 
+from validators.models import MODEL_MAP
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
 SCHEMA_DIR = Path(__file__).resolve().parent.parent / "schemas"
+# Schema files at least this large are parsed by orjson straight from a read-only
+# memory map instead of being read into a bytes copy first
+MMAP_THRESHOLD = 1 << 20
+# schema name -> file, scanned once so a lookup is a dict access instead of a stat
+_SCHEMA_FILES = {p.name[:-len(".schema.json")]: p for p in SCHEMA_DIR.glob("*.schema.json")}
 MODELS_MODULE = "validators.models"
 
+# Skip building the docs URL and context for each Pydantic error
+_ERRORS_KWARGS = {"include_url": False, "include_context": False}
+
 class ValidationError(Exception):
     """
     Unified validation error for JSON Schema and Pydantic model validation.
@@ -18,32 +43,153 @@ class ValidationError(Exception):
         self.errors = errors
 
 def _load_json_schema(schema_name: str) -> dict:
-    schema_file = SCHEMA_DIR / f"{schema_name}.schema.json"
-    if not schema_file.exists():
-        raise FileNotFoundError(f"JSON Schema file not found: {schema_file}")
-    with open(schema_file, "r", encoding="utf-8") as f:
-        return json.load(f)
+    schema_file = _SCHEMA_FILES.get(schema_name)
+    if schema_file is None:
+        raise FileNotFoundError(f"JSON Schema file not found: {SCHEMA_DIR / f'{schema_name}.schema.json'}")
+    if orjson is None or schema_file.stat().st_size < MMAP_THRESHOLD:
+        return json_loads(schema_file.read_bytes())
+    with open(schema_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+def _schema_error(message: str, validator: Any, path: List[Any]) -> dict:
+    return {"type": "jsonschema", "message": message, "validator": validator, "path": path}
+
+def _instance_path(data: Any, names: List[str]) -> List[Any]:
+    """
+    Turn fastjsonschema's all-string path into jsonschema's, where array
+    indexes are ints, by following the path through data.
+    """
+    path = []
+    node = data
+    for name in names:
+        if isinstance(node, list):
+            name = int(name)
+        path.append(name)
+        try:
+            node = node[name]
+        except (LookupError, TypeError):
+            node = None
+    return path
+
+def _jsonschema_error(e: JsonSchemaValidationError) -> dict:
+    return _schema_error(e.message, e.validator, list(e.path))
+
+@functools.lru_cache(maxsize=None)
+def _get_validator(schema_name: str) -> Optional[Callable[..., List[dict]]]:
+    """
+    Load and compile the JSON Schema for schema_name once.
+    The returned check(data, fail_fast=True) gives the error dicts for data, empty if valid.
+    With fail_fast it stops at the first error: top-level required and unexpected keys
+    are checked first, then the full schema with fastjsonschema generated code when
+    installed. Otherwise every error is collected with the jsonschema validator.
+    Returns None when there is no schema file, so callers can skip the JSON Schema pass.
+    """
+    try:
+        schema = _load_json_schema(schema_name)
+    except FileNotFoundError:
+        return None
+
+    validator_cls = validator_for(schema, default=Draft7Validator)
+    validator_cls.check_schema(schema)
+    validator = validator_cls(schema)
+    # format is an annotation for Draft7Validator unless a format_checker is given,
+    # so fastjsonschema's format checks are turned off to report the same errors
+    compiled = fastjsonschema.compile(schema, use_formats=False) if fastjsonschema is not None else None
+    # Top-level key rules, checked up front so the common rejections (a missing
+    # required key, an unexpected key) skip the full schema walk
+    required = tuple(schema.get("required", ()))
+    closed = schema.get("additionalProperties") is False and "patternProperties" not in schema
+    allowed = frozenset(schema.get("properties", ())) if closed else None
+
+    def check_keys(data: dict) -> Optional[dict]:
+        for name in required:
+            if name not in data:
+                return _schema_error(f"{name!r} is a required property", "required", [])
+        if allowed is not None:
+            extras = [key for key in data if key not in allowed]
+            if extras:
+                verb = "was" if len(extras) == 1 else "were"
+                return _schema_error(
+                    f"Additional properties are not allowed ({', '.join(map(repr, extras))} {verb} unexpected)",
+                    "additionalProperties",
+                    [],
+                )
+        return None
+
+    def check(data: Any, fail_fast: bool = True) -> List[dict]:
+        if not fail_fast:
+            return [_jsonschema_error(e) for e in validator.iter_errors(data)]
+        if isinstance(data, dict):
+            error = check_keys(data)
+            if error is not None:
+                return [error]
+        if compiled is not None:
+            try:
+                compiled(data)
+            except fastjsonschema.JsonSchemaValueException as e:
+                # drop the leading "data" root from the path
+                return [_schema_error(e.message, e.rule, _instance_path(data, e.path[1:]))]
+            return []
+        e = next(validator.iter_errors(data), None)
+        return [] if e is None else [_jsonschema_error(e)]
+
+    return check
+
+def _pydantic_errors(e: PydanticValidationError) -> List[dict]:
+    return [
+        {
+            "type": "pydantic",
+            "loc": err.get("loc"),
+            "msg": err.get("msg"),
+            "type_detail": err.get("type"),
+        }
+        for err in e.errors(**_ERRORS_KWARGS)
+    ]
 
 def _get_model_class(schema_name: str) -> Type[BaseModel]:
     try:
-        module = importlib.import_module(MODELS_MODULE)
-    except ImportError as e:
-        raise ImportError(f"Could not import models module '{MODELS_MODULE}': {e}") from e
-    class_name = "".join(part.capitalize() for part in schema_name.split("_"))
-    model_class = getattr(module, class_name, None)
-    if model_class is None:
-        raise ImportError(f"Pydantic model '{class_name}' not found in '{MODELS_MODULE}'")
-    if not issubclass(model_class, BaseModel):
-        raise TypeError(f"{class_name} is not a subclass of pydantic.BaseModel")
-    return model_class
-
-def validate(schema_name: str, data: dict) -> BaseModel:
+        return MODEL_MAP[schema_name]
+    except KeyError:
+        raise ImportError(f"No Pydantic model registered for '{schema_name}' in '{MODELS_MODULE}'.MODEL_MAP") from None
+
+def _validate_with(
+    model_class: Type[BaseModel],
+    check: Optional[Callable[..., List[dict]]],
+    data: Any,
+    fail_fast: bool,
+) -> Tuple[Optional[BaseModel], List[dict]]:
+    errors = []
+    # 1. Pydantic model validation
+    model_instance = None
+    try:
+        model_instance = model_class.model_validate(data)
+    except PydanticValidationError as e:
+        errors.extend(_pydantic_errors(e))
+    # 2. JSON Schema validation (skipped when the caller turned strict_jsonschema off).
+    # With fail_fast, data the model already rejected is not walked a second time.
+    if check is not None and not (fail_fast and errors):
+        errors.extend(check(data, fail_fast))
+    return model_instance, errors
+
+def validate(
+    schema_name: str,
+    data: dict,
+    strict_jsonschema: bool = True,
+    fail_fast: bool = True,
+) -> BaseModel:
     """
-    Validate the given data against the JSON Schema and Pydantic model for schema_name.
+    Validate the given data against the Pydantic model for schema_name and,
+    unless strict_jsonschema is False, against its JSON Schema as well.
 
     Args:
         schema_name: Name of the schema/model (without extension or suffix).
         data: The raw dict to validate.
+        strict_jsonschema: Also run the JSON Schema pass (the default). The models port
+            their schemas' constraints but are not proven equivalent to them (see
+            validators/models.py), so pass False only to check the model alone.
+        fail_fast: Report only the first JSON Schema error instead of all of them, and
+            skip the JSON Schema pass when the Pydantic model has already failed.
 
     Returns:
         An instance of the corresponding Pydantic model.
@@ -51,38 +197,70 @@ def validate(schema_name: str, data: dict) -> BaseModel:
     Raises:
         ValidationError: Aggregated validation errors from JSON Schema or Pydantic.
         FileNotFoundError: If the JSON Schema file is missing.
-        ImportError: If the Pydantic model cannot be imported.
-        TypeError: If the imported model is not a BaseModel subclass.
+        ImportError: If no Pydantic model is registered for schema_name.
     """
-    errors = []
-    # 1. JSON Schema validation
-    try:
-        schema = _load_json_schema(schema_name)
-        jsonschema_validate(instance=data, schema=schema)
-    except FileNotFoundError:
-        # No JSON Schema to validate against, skip
-        pass
-    except JsonSchemaValidationError as e:
-        errors.append({
-            "type": "jsonschema",
-            "message": e.message,
-            "validator": e.validator,
-            "path": list(e.path),
-        })
-    # 2. Pydantic model validation
     model_class = _get_model_class(schema_name)
-    model_instance = None
-    try:
-        model_instance = model_class.parse_obj(data)
-    except PydanticValidationError as e:
-        for err in e.errors():
-            errors.append({
-                "type": "pydantic",
-                "loc": err.get("loc"),
-                "msg": err.get("msg"),
-                "type_detail": err.get("type"),
-            })
-    # Raise if any errors encountered
+    check = _get_validator(schema_name) if strict_jsonschema else None
+    model_instance, errors = _validate_with(model_class, check, data, fail_fast)
     if errors:
         raise ValidationError(errors)
-    return model_instance
\ No newline at end of file
+    return model_instance
+
+def validate_many(
+    schema_name: str,
+    items: Iterable[dict],
+    strict_jsonschema: bool = True,
+    fail_fast: bool = True,
+) -> List[Tuple[Optional[BaseModel], Optional[ValidationError]]]:
+    """
+    Validate a batch of dicts for schema_name, resolving the model and the
+    compiled JSON Schema once for the whole batch.
+
+    Returns:
+        One (model_instance, None) or (None, ValidationError) pair per item, in order.
+
+    Raises:
+        ImportError: If no Pydantic model is registered for schema_name.
+    """
+    model_class = _get_model_class(schema_name)
+    check = _get_validator(schema_name) if strict_jsonschema else None
+    results = []
+    for data in items:
+        model_instance, errors = _validate_with(model_class, check, data, fail_fast)
+        results.append((None, ValidationError(errors)) if errors else (model_instance, None))
+    return results
+
+def validate_json(
+    schema_name: str,
+    raw: Union[str, bytes],
+    strict_jsonschema: bool = True,
+    fail_fast: bool = True,
+) -> BaseModel:
+    """
+    Parse and validate a raw JSON document for schema_name.
+
+    With strict_jsonschema the document is decoded first and handed to
+    validate(). Without it the JSON is parsed and validated in one pass by the
+    model's compiled validator, without building an intermediate dict.
+
+    Raises:
+        ValidationError: If raw is not valid JSON or fails validation; invalid
+            JSON is reported as a pydantic error with type_detail "json_invalid".
+        ImportError: If no Pydantic model is registered for schema_name.
+    """
+    model_class = _get_model_class(schema_name)
+    if not strict_jsonschema:
+        try:
+            return model_class.model_validate_json(raw)
+        except PydanticValidationError as e:
+            raise ValidationError(_pydantic_errors(e)) from None
+    try:
+        data = json_loads(raw)
+    except ValueError as e:
+        raise ValidationError([{
+            "type": "pydantic",
+            "loc": (),
+            "msg": f"Invalid JSON: {e}",
+            "type_detail": "json_invalid",
+        }]) from None
+    return validate(schema_name, data, strict_jsonschema, fail_fast)